@@ -1,8 +1,66 @@
 from src.interface import Wordle
+from src.assets import DATA_DIR, FONT_PATH, WEB_FONT_PATH, MIN_WORD_LENGTH, MAX_WORD_LENGTH, word_list_path
+from src.lexicon import WORD_LENGTH, get_lexicon
+from src.logic import MAX_GUESSES
+from src.state import MAX_GUESS_LIMIT
+from src.stats import PLAYER
+from src.metrics import metrics, serve_prometheus, write_periodically
+import argparse
+import logging
 import flet as ft
 
 def main(page: ft.Page):
     Wordle(page)
 
+def create_game(page: ft.Page, font_path: str, word_length: int, max_guesses: int, boards: int, daily: bool = False, seed: int = None, hard_mode: bool = False, player: str = PLAYER):
+    if boards > 1:
+        from src.multiboard import MultiWordle # needs numpy, which the single-board game never imports
+        return MultiWordle(page, boards=boards, font_path=font_path, word_length=word_length, max_guesses=max_guesses, player=player)
+    return Wordle(page, font_path=font_path, word_length=word_length, max_guesses=max_guesses or MAX_GUESSES, daily=daily, seed=seed, hard_mode=hard_mode, player=player)
+
+def serve(port: int, idle_timeout: float, open_browser: bool, word_length: int, max_guesses: int, boards: int, daily: bool, seed: int, hard_mode: bool):
+    from src.sessions import SessionManager, browser_player
+    get_lexicon(word_list_path(word_length), word_length)
+    sessions = SessionManager(idle_timeout=idle_timeout)
+
+    def web_main(page: ft.Page):
+        sessions.open(page, create_game(page, WEB_FONT_PATH, word_length, max_guesses, boards, daily, seed, hard_mode, browser_player(page)))
+
+    ft.app(target=web_main, port=port, assets_dir=DATA_DIR, view=ft.AppView.WEB_BROWSER if open_browser else None)
+
 if __name__ == "__main__":
-    ft.app(target=main)
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--web", action="store_true", help="serve many browser sessions from this process")
+    parser.add_argument("--port", type=int, default=8550)
+    parser.add_argument("--idle-timeout", type=float, default=900, help="seconds before an idle web session is evicted")
+    parser.add_argument("--open", action="store_true", help="open a browser tab when serving")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH, help=f"letters per word ({MIN_WORD_LENGTH} to {MAX_WORD_LENGTH}, only {WORD_LENGTH} ships; build other lengths with python -m src.wordlists)")
+    parser.add_argument("--guesses", type=int, default=None, help=f"number of guesses allowed (default {MAX_GUESSES}, or boards + 5)")
+    parser.add_argument("--boards", type=int, choices=(1, 4, 8, 16), default=1, help="answers to solve at once")
+    parser.add_argument("--daily", action="store_true", help="play today's shared puzzle")
+    parser.add_argument("--seed", type=int, default=None, help="replay the answer sequence starting at this game number")
+    parser.add_argument("--hard", action="store_true", help="every guess must reuse all revealed hints")
+    parser.add_argument("--metrics-port", type=int, default=None, help="serve input latency metrics in Prometheus text format")
+    parser.add_argument("--metrics-file", default=None, help="write input latency metrics as JSON every 10 seconds")
+    args = parser.parse_args()
+    if args.guesses is not None and not 1 <= args.guesses <= MAX_GUESS_LIMIT:
+        parser.error(f"--guesses must be between 1 and {MAX_GUESS_LIMIT}")
+    if args.boards > 1 and args.hard:
+        parser.error("--hard is only available with a single board")
+    if args.boards > 1 and (args.daily or args.seed is not None):
+        parser.error("--daily and --seed are only available with a single board")
+    try:
+        word_list_path(args.length)
+    except (ValueError, FileNotFoundError) as error:
+        parser.error(str(error))
+    if args.metrics_port or args.metrics_file:
+        metrics.enabled = True
+        if args.metrics_port:
+            serve_prometheus(args.metrics_port)
+        if args.metrics_file:
+            write_periodically(args.metrics_file)
+    if args.web:
+        logging.basicConfig(level=logging.INFO)
+        serve(args.port, args.idle_timeout, args.open, args.length, args.guesses, args.boards, args.daily, args.seed, args.hard)
+    else:
+        ft.app(target=lambda page: create_game(page, FONT_PATH, args.length, args.guesses, args.boards, args.daily, args.seed, args.hard))
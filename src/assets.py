@@ -0,0 +1,35 @@
+import os
+import sys
+
+def get_asset_path(relative_path: str) -> str:
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+DATA_DIR = get_asset_path("data")
+FONT_FILE = "karnakcondensed-normal-700.ttf"
+FONT_PATH = os.path.join(DATA_DIR, FONT_FILE)
+WEB_FONT_PATH = "/" + FONT_FILE # served from DATA_DIR as the web assets dir
+WORD_LIST_PATH = os.path.join(DATA_DIR, "wordle.json")
+PACKED_WORD_LIST_PATH = os.path.join(DATA_DIR, "wordle.bin")
+CACHE_DIR = os.environ.get("WORDLE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "wordle"))
+MIN_WORD_LENGTH = 4
+MAX_WORD_LENGTH = 8
+
+def word_list_path(word_length: int) -> str:
+    if not MIN_WORD_LENGTH <= word_length <= MAX_WORD_LENGTH:
+        raise ValueError(f"word length must be between {MIN_WORD_LENGTH} and {MAX_WORD_LENGTH}")
+    for name in (f"wordle-{word_length}.bin", f"wordle-{word_length}.json"):
+        path = os.path.join(DATA_DIR, name)
+        if os.path.exists(path):
+            return path
+    if word_length == 5:
+        return PACKED_WORD_LIST_PATH if os.path.exists(PACKED_WORD_LIST_PATH) else WORD_LIST_PATH
+    missing = os.path.join(DATA_DIR, f"wordle-{word_length}")
+    raise FileNotFoundError(f"no word list for {word_length}-letter words: {missing}.bin or {missing}.json is missing, build one with python -m src.wordlists --length {word_length}")
+
+def answer_list_path(word_length: int) -> str:
+    path = os.path.join(DATA_DIR, f"wordle-{word_length}-answers.json")
+    return path if os.path.exists(path) else word_list_path(word_length)
@@ -0,0 +1,102 @@
+import argparse
+import json
+import os
+import sys
+from src.assets import word_list_path
+from src.lexicon import WORD_LENGTH, get_lexicon
+from src.simulator import simulate
+
+BENCHMARK_STRATEGIES = ("random", "frequency", "entropy", "minimax")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "solver-baseline.json")
+TIME_TOLERANCE = 0.5
+
+def summarize(report: dict) -> dict:
+    games = report["games"]
+    wins = [int(guesses) for guesses in report["distribution"] if guesses != "X"]
+    return {
+        "games": games,
+        "mean_guesses": round(report["mean_guesses"], 4) if report["mean_guesses"] is not None else None,
+        "failure_rate": round(report["failures"] / games, 4) if games else 0.0,
+        "worst_case": "X" if report["failures"] else max(wins, default=0),
+        "distribution": report["distribution"],
+        "seconds": round(report["seconds"], 3),
+    }
+
+def run_suite(file_path: str, strategies: list[str], workers: int = None, limit: int = None, word_length: int = WORD_LENGTH) -> dict:
+    lexicon = get_lexicon(file_path, word_length)
+    answers = list(lexicon)[:limit]
+    results = {}
+    for name in strategies:
+        report = simulate(file_path, name, answers, workers, word_length)
+        results[name] = summarize(report)
+        print(f"{name}: mean {results[name]['mean_guesses']}, failures {report['failures']}, worst {results[name]['worst_case']}, {results[name]['seconds']} s", file=sys.stderr)
+    return {
+        "word_list": os.path.basename(file_path),
+        "lexicon_digest": lexicon.digest,
+        "word_length": word_length,
+        "games": len(answers),
+        "workers": workers or os.cpu_count() or 1,
+        "strategies": results,
+    }
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    if (current["lexicon_digest"], current["games"]) != (baseline["lexicon_digest"], baseline["games"]):
+        return ["baseline was recorded for a different word list or answer count"]
+    problems = []
+    for name, result in current["strategies"].items():
+        pinned = baseline["strategies"].get(name)
+        if pinned is None:
+            continue
+        # Every strategy is deterministic, so any change in outcomes points at
+        # compare_word, candidate filtering or the solver itself.
+        if result["distribution"] != pinned["distribution"]:
+            problems.append(f"{name}: results changed, mean {pinned['mean_guesses']} -> {result['mean_guesses']}, worst {pinned['worst_case']} -> {result['worst_case']}")
+    return problems
+
+def slowdowns(current: dict, baseline: dict, tolerance: float = TIME_TOLERANCE) -> list[str]:
+    # Pinned timings are wall-clock seconds from one machine, so by default
+    # they only produce warnings; --strict-timing turns them into failures.
+    if current["workers"] != baseline["workers"]:
+        return []
+    problems = []
+    for name, result in current["strategies"].items():
+        pinned = baseline["strategies"].get(name)
+        if pinned is not None and result["seconds"] > pinned["seconds"] * (1 + tolerance):
+            problems.append(f"{name}: {result['seconds']} s against a baseline of {pinned['seconds']} s")
+    return problems
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play every word with each solver strategy and compare against the pinned baseline.")
+    parser.add_argument("--words", default=None, help="word list to play, defaults to the list for --length")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH)
+    parser.add_argument("--strategies", nargs="+", default=list(BENCHMARK_STRATEGIES))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--limit", type=int, default=None, help="only play the first N answers")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=TIME_TOLERANCE, help="allowed slowdown before a timing counts as a regression")
+    parser.add_argument("--strict-timing", action="store_true", help="fail on timing regressions instead of only warning")
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline with this run")
+    args = parser.parse_args()
+    words = args.words or word_list_path(args.length)
+    current = run_suite(words, args.strategies, args.workers, args.limit, args.length)
+    text = json.dumps(current, indent=2)
+    print(text)
+    if args.update:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as file:
+            file.write(text + "\n")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if current["workers"] != baseline["workers"]:
+            print("timings not compared: the baseline used a different worker count", file=sys.stderr)
+        problems = compare(current, baseline)
+        slow = slowdowns(current, baseline, args.tolerance)
+        if args.strict_timing:
+            problems += slow
+        else:
+            for problem in slow:
+                print(f"WARNING {problem}", file=sys.stderr)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        sys.exit(1 if problems else 0)
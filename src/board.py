@@ -1,8 +1,10 @@
 import flet as ft
 import asyncio
+from src.lexicon import WORD_LENGTH
+from src.logic import MAX_GUESSES
 
-MAX_GUESS = 6
-WORD_LENGTH = 5
+TYPE_ANIMATION_MS = 100
+REVEAL_STEP_MS = 150
 
 HINTS_COLORS = {
     1: ft.Colors.GREEN_600, 
@@ -10,15 +12,27 @@ HINTS_COLORS = {
     3: ft.Colors.GREY_700 
 }
 
+_borders = {}
+
+def cell_border(color: str) -> ft.Border:
+    border = _borders.get(color)
+    if border is None:
+        border = _borders[color] = ft.border.all(2, color)
+    return border
+
 class GridBoard:
 
-    def __init__(self):
+    def __init__(self, max_guess: int = MAX_GUESSES, word_length: int = WORD_LENGTH, cell_size: int = 60):
+        self.max_guess = max_guess
+        self.word_length = word_length
+        self.cell_size = cell_size
         self.board_controls = []
+        self.cell_state = {}
         
     def create_board_controls(self, guesses: list[list[str]]):
-            for r in range(MAX_GUESS):
+            for r in range(self.max_guess):
                 row_controls = []
-                for c in range(WORD_LENGTH):
+                for c in range(self.word_length):
                     text_field = ft.TextField(
                         value = guesses[r][c],
                         text_align = ft.TextAlign.CENTER,
@@ -26,94 +40,101 @@ class GridBoard:
                         border=ft.InputBorder.NONE, 
                         bgcolor=ft.Colors.BLACK,
                         content_padding=0,
-                        text_size=32,
+                        text_size=self.cell_size * 32 // 60,
                         text_style=ft.TextStyle(weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE),
                         max_length=1, 
                         cursor_height=0, 
                         cursor_color=ft.Colors.TRANSPARENT,
                     )
                     box_container = ft.Container(
-                        width=60, 
-                        height=60,
+                        width=self.cell_size, 
+                        height=self.cell_size,
                         content=text_field,
                         alignment=ft.alignment.center,
                         border_radius=3, 
                         border=ft.border.all(2, ft.Colors.GREY_700), 
                         data={"row": r, "col": c},
                         scale=ft.Scale(scale=1),
-                        animate_scale=ft.Animation(100, ft.AnimationCurve.EASE_OUT),
+                        animate_scale=ft.Animation(TYPE_ANIMATION_MS, ft.AnimationCurve.EASE_OUT),
                     )
                     row_controls.append(box_container)
-                self.board_controls.append(ft.Row(alignment=ft.MainAxisAlignment.CENTER, controls=row_controls, spacing=5))
+                self.board_controls.append(ft.Row(alignment=ft.MainAxisAlignment.CENTER, controls=row_controls, spacing=max(2, self.cell_size // 12)))
             return self.board_controls
         
-    def update_board_display(self, history: list, guesses: list[list[str]], row: int, col: int, letter_col: int, game_over: bool):
-        for r in range (MAX_GUESS):
-            row_controls = self.board_controls[r].controls
+    def update_board_display(self, history: list, guesses: list[list[str]], row: int, col: int, letter_col: int, game_over: bool) -> list:
+        changed = []
+        for r in range(self.max_guess):
             if r<len(history):
                 history_log = history[r]
             else:
                 history_log = None
-            for c in range(WORD_LENGTH):
-                box = row_controls[c]
-                text_field_control = box.content 
-                text_field_control.value = guesses[r][c]
-                box.scale.scale = 1.0
-                box.bgcolor = ft.Colors.BLACK
-                box.border = ft.border.all(2, ft.Colors.GREY_700)
-                text_field_control.text_style.color = ft.Colors.WHITE
-                text_field_control.bgcolor = ft.Colors.BLACK
-                if history_log:
-                    word, hints = history_log
-                    hint = hints[c]
-                    color = HINTS_COLORS.get(hint, ft.Colors.BLACK)
-                    box.bgcolor = color
-                    box.border = ft.border.all(2,color)                 
-                    text_field_control.bgcolor = color
-                    
-                    if color == ft.Colors.YELLOW_600:
-                        text_field_control.text_style.color = ft.Colors.BLACK
-                    else:
-                        text_field_control.text_style.color = ft.Colors.WHITE
-                elif r == row:
-                    if c < letter_col: 
-                        box.border = ft.border.all(2, ft.Colors.GREY_500)
-                        if c == letter_col - 1 and not game_over:
-                            box.scale.scale = 1.1
-                    elif c == letter_col and not game_over: 
-                        box.border = ft.border.all(2, ft.Colors.WHITE)
-                        
-    async def animate_row_bouncing(self, row_index: int, hints: list, word: list):
+            self.update_row(r, history_log, guesses[r], row, letter_col, game_over, changed)
+        return changed
+
+    def update_row(self, r: int, history_log: tuple, letters: list[str], row: int, letter_col: int, game_over: bool, changed: list) -> list:
+        row_controls = self.board_controls[r].controls
+        for c in range(self.word_length):
+            border_color = ft.Colors.GREY_700
+            bgcolor = ft.Colors.BLACK
+            text_color = ft.Colors.WHITE
+            scale = 1.0
+            if history_log:
+                word, hints = history_log
+                bgcolor = border_color = HINTS_COLORS.get(hints[c], ft.Colors.BLACK)
+                if bgcolor == ft.Colors.YELLOW_600:
+                    text_color = ft.Colors.BLACK
+            elif r == row:
+                if c < letter_col: 
+                    border_color = ft.Colors.GREY_500
+                    if c == letter_col - 1 and not game_over:
+                        scale = 1.1
+                elif c == letter_col and not game_over: 
+                    border_color = ft.Colors.WHITE
+            box = row_controls[c]
+            if self.set_cell(box, r, c, letters[c], bgcolor, border_color, text_color, scale):
+                changed.append(box)
+        return changed
+
+    def set_cell(self, box: ft.Container, r: int, c: int, value: str, bgcolor: str, border_color: str, text_color: str, scale: float) -> bool:
+        state = (value, bgcolor, border_color, text_color, scale)
+        if self.cell_state.get((r, c)) == state:
+            return False
+        self.cell_state[(r, c)] = state
+        text_field = box.content
+        text_field.value = value
+        text_field.bgcolor = bgcolor
+        text_field.text_style.color = text_color
+        box.bgcolor = bgcolor
+        box.border = cell_border(border_color)
+        box.scale.scale = scale
+        return True
+
+    async def animate_row_bouncing(self, row_index: int, hints: list, word: list, update, extra_controls: list = ()):
         row_controls = self.board_controls[row_index].controls
-        for c in range(WORD_LENGTH):
+        for c in range(self.word_length):
             box = row_controls[c]
-            box.scale.scale = 1.1
-            box.update()
-            await asyncio.sleep(0.1) 
+            reveal = ft.Animation(REVEAL_STEP_MS * (c + 1), ft.AnimationCurve.EASE_OUT)
+            box.animate = reveal
+            box.animate_scale = reveal
             color = HINTS_COLORS.get(hints[c], ft.Colors.BLACK)
-            box.bgcolor = color
-            box.border = ft.border.all(2, color)
-            text_field = box.content
-            text_field.value = word[c]
-            text_field.bgcolor = color
             if color == HINTS_COLORS[2]: 
-                text_field.text_style.color = ft.Colors.BLACK
+                text_color = ft.Colors.BLACK
             else:
-                text_field.text_style.color = ft.Colors.WHITE
+                text_color = ft.Colors.WHITE
+            self.set_cell(box, row_index, c, word[c], color, color, text_color, 1.1)
+        update(*row_controls, *extra_controls)
+        await asyncio.sleep(REVEAL_STEP_MS * self.word_length / 1000)
+        for c in range(self.word_length):
+            box = row_controls[c]
+            box.animate = None # colours change instantly again, so a restart does not fade the old row out
+            box.animate_scale = ft.Animation(TYPE_ANIMATION_MS, ft.AnimationCurve.EASE_OUT)
+            self.cell_state[(row_index, c)] = self.cell_state[(row_index, c)][:4] + (1.0,)
             box.scale.scale = 1.0
-            box.update()
-            await asyncio.sleep(0.2)
+        update(*row_controls)
 
     def reset(self):
-        for r in range(MAX_GUESS):
+        self.cell_state.clear()
+        for r in range(self.max_guess):
             row_controls = self.board_controls[r].controls
-            for c in range(WORD_LENGTH):
-                box = row_controls[c]
-                text_field = box.content
-                text_field.value = ""
-                box.bgcolor = ft.Colors.BLACK
-                box.border = ft.border.all(2, ft.Colors.GREY_700)
-                text_field.bgcolor = ft.Colors.BLACK
-                text_field.text_style.color = ft.Colors.WHITE
-                box.scale.scale = 1
-                box.update()
\ No newline at end of file
+            for c in range(self.word_length):
+                self.set_cell(row_controls[c], r, c, "", ft.Colors.BLACK, ft.Colors.GREY_700, ft.Colors.WHITE, 1.0)
@@ -0,0 +1,34 @@
+import numpy as np
+from src.feedback import FeedbackTable, encode_lexicon, pattern_matrix
+from src.hints import encode_pattern
+
+class CandidateSet:
+
+    def __init__(self, lexicon, table: FeedbackTable = None):
+        self.lexicon = lexicon
+        self.table = table
+        self.indices = np.arange(len(lexicon), dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __contains__(self, word: str) -> bool:
+        i = self.lexicon.index_of(word)
+        return i >= 0 and bool(np.any(self.indices == i))
+
+    def __iter__(self):
+        for i in self.indices:
+            yield self.lexicon[int(i)]
+
+    def narrow(self, guess: str, hints: list[int]):
+        code = encode_pattern(hints)
+        guess_index = self.lexicon.index_of(guess)
+        if self.table is not None and guess_index >= 0:
+            patterns = self.table.table[guess_index, self.indices]
+        else:
+            guess_codes = np.frombuffer(guess.lower().encode("ascii"), dtype=np.uint8)[None, :]
+            patterns = pattern_matrix(guess_codes, encode_lexicon(self.lexicon)[self.indices])[0]
+        self.indices = self.indices[patterns == code]
+
+    def reset(self):
+        self.indices = np.arange(len(self.lexicon), dtype=np.int32)
@@ -0,0 +1,60 @@
+from src.hints import CORRECT, PRESENT, ABSENT
+
+ALL_LETTERS = (1 << 26) - 1
+ORDINALS = ("1ST", "2ND", "3RD", "4TH", "5TH", "6TH", "7TH", "8TH")
+
+def letter_bit(letter: str) -> int:
+    return 1 << (ord(letter) - 65)
+
+class Constraints:
+    __slots__ = ("word_length", "rows", "allowed", "min_counts", "correct", "present", "guessed")
+
+    def __init__(self, word_length: int):
+        self.word_length = word_length
+        self.rows = 0
+        self.allowed = [ALL_LETTERS] * word_length # letters each position may still hold, one bit per letter
+        self.min_counts = {} # copies of a letter every later guess has to contain
+        self.correct = 0
+        self.present = 0
+        self.guessed = 0
+
+    def add(self, word: str, hints: list[int]):
+        counts = {}
+        for i, (letter, hint) in enumerate(zip(word.upper(), hints)):
+            bit = letter_bit(letter)
+            self.guessed |= bit
+            if hint == CORRECT:
+                self.allowed[i] = bit
+                self.correct |= bit
+            elif hint == PRESENT:
+                self.present |= bit
+            else:
+                continue
+            counts[letter] = counts.get(letter, 0) + 1
+        for letter, n in counts.items():
+            if n > self.min_counts.get(letter, 0):
+                self.min_counts[letter] = n
+        self.rows += 1
+
+    def violation(self, word: str) -> str:
+        word = word.upper()
+        for i, letter in enumerate(word):
+            if not self.allowed[i] & letter_bit(letter):
+                return f"{ORDINALS[i]} LETTER MUST BE {chr(self.allowed[i].bit_length() + 64)}"
+        for letter, n in self.min_counts.items():
+            if word.count(letter) < n:
+                return f"GUESS MUST CONTAIN {letter}"
+        return None
+
+def key_hints(*constraints: Constraints) -> dict[str, int]:
+    correct = present = guessed = 0
+    for c in constraints:
+        correct |= c.correct
+        present |= c.present
+        guessed |= c.guessed
+    hints = {}
+    for i in range(26):
+        bit = 1 << i
+        if guessed & bit:
+            hints[chr(i + 65)] = CORRECT if correct & bit else PRESENT if present & bit else ABSENT
+    return hints
@@ -0,0 +1,127 @@
+import os
+import threading
+import numpy as np
+from src.assets import CACHE_DIR
+from src.hints import CORRECT, PRESENT, ABSENT
+
+CHUNK_CELLS = 1 << 22
+
+def pattern_dtype(word_length: int):
+    return np.uint8 if 3 ** word_length <= 256 else np.uint16 if 3 ** word_length <= 65536 else np.uint32
+
+def encode_words(words, word_length: int = None) -> np.ndarray:
+    words = list(words)
+    if word_length is None:
+        word_length = len(words[0]) if words else 0
+    data = "".join(words).lower().encode("ascii")
+    if len(data) != len(words) * word_length:
+        raise ValueError("all words must have the same length")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(words), word_length)
+
+_encoded = {}
+
+def encode_lexicon(lexicon) -> np.ndarray:
+    codes = _encoded.get(lexicon)
+    if codes is None:
+        if hasattr(lexicon, "buffer"):
+            codes = np.frombuffer(lexicon.buffer, dtype=np.uint8, count=len(lexicon) * lexicon.word_length, offset=lexicon.offset)
+            codes = codes.reshape(len(lexicon), lexicon.word_length)
+        else:
+            codes = encode_words(lexicon, lexicon.word_length)
+        _encoded[lexicon] = codes
+    return codes
+
+def _as_codes(words) -> np.ndarray:
+    if isinstance(words, np.ndarray):
+        return words
+    return encode_words(words)
+
+def _feedback_block(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    word_length = guesses.shape[1]
+    green = guesses[:, None, :] == answers[None, :, :]
+    hints = np.full(green.shape, ABSENT, dtype=np.uint8)
+    hints[green] = CORRECT
+    for i in range(word_length):
+        letter = guesses[:, i][:, None]
+        available = np.zeros(green.shape[:2], dtype=np.int8)
+        for k in range(word_length):
+            available += (answers[None, :, k] == letter) & ~green[:, :, k]
+        used = np.zeros(green.shape[:2], dtype=np.int8)
+        for j in range(i):
+            used += (guesses[:, j] == guesses[:, i])[:, None] & ~green[:, :, j]
+        hints[:, :, i][~green[:, :, i] & (used < available)] = PRESENT
+    return hints
+
+def _chunk_rows(answer_count: int, word_length: int) -> int:
+    return max(1, CHUNK_CELLS // max(1, answer_count * word_length))
+
+def feedback_matrix(guesses, answers) -> np.ndarray:
+    guesses = _as_codes(guesses)
+    answers = _as_codes(answers)
+    out = np.empty((len(guesses), len(answers), guesses.shape[1]), dtype=np.uint8)
+    step = _chunk_rows(len(answers), guesses.shape[1])
+    for start in range(0, len(guesses), step):
+        out[start:start + step] = _feedback_block(guesses[start:start + step], answers)
+    return out
+
+def pattern_matrix(guesses, answers, out: np.ndarray = None) -> np.ndarray:
+    guesses = _as_codes(guesses)
+    answers = _as_codes(answers)
+    word_length = guesses.shape[1]
+    dtype = pattern_dtype(word_length)
+    if out is None:
+        out = np.empty((len(guesses), len(answers)), dtype=dtype)
+    weights = (3 ** np.arange(word_length)).astype(dtype)
+    step = _chunk_rows(len(answers), word_length)
+    for start in range(0, len(guesses), step):
+        digits = _feedback_block(guesses[start:start + step], answers) - CORRECT
+        out[start:start + step] = (digits.astype(dtype) * weights).sum(axis=2, dtype=dtype)
+    return out
+
+def pattern_row(guess: str, answers) -> np.ndarray:
+    return pattern_matrix(encode_words([guess]), answers)[0]
+
+class FeedbackTable:
+
+    def __init__(self, lexicon, table: np.ndarray):
+        self.lexicon = lexicon
+        self.table = table
+
+    def pattern(self, guess: str, answer: str) -> int:
+        return int(self.table[self.lexicon.index_of(guess), self.lexicon.index_of(answer)])
+
+    def row(self, guess: str) -> np.ndarray:
+        return self.table[self.lexicon.index_of(guess)]
+
+def build_feedback_table(lexicon, path: str) -> np.ndarray:
+    words = encode_lexicon(lexicon)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    table = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=pattern_dtype(lexicon.word_length), shape=(len(words), len(words)))
+    pattern_matrix(words, words, out=table)
+    table.flush()
+    del table
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode="r")
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+def load_feedback_table(lexicon, cache_dir: str = None) -> FeedbackTable:
+    cache_dir = cache_dir or CACHE_DIR
+    key = (lexicon, cache_dir) # by identity, so a hit never hashes the word list
+    table = _tables.get(key)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(key)
+            if table is None:
+                path = os.path.join(cache_dir, f"feedback-{lexicon.word_length}-{lexicon.digest[:16]}.npy")
+                os.makedirs(cache_dir, exist_ok=True)
+                try:
+                    data = np.load(path, mmap_mode="r")
+                    if data.shape != (len(lexicon), len(lexicon)):
+                        raise ValueError(f"{path} does not match the lexicon")
+                except (OSError, ValueError):
+                    data = build_feedback_table(lexicon, path)
+                table = FeedbackTable(lexicon, data)
+                _tables[key] = table
+    return table
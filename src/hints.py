@@ -0,0 +1,20 @@
+CORRECT = 1
+PRESENT = 2
+ABSENT = 3
+
+# A pattern packs one row of hints into a single base-3 integer: position i
+# contributes (hint - CORRECT) * 3**i, so a solved row is always 0.
+SOLVED = 0
+
+def encode_pattern(hints: list[int]) -> int:
+    code = 0
+    for i, hint in enumerate(hints):
+        code += (hint - CORRECT) * 3 ** i
+    return code
+
+def decode_pattern(code: int, word_length: int) -> list[int]:
+    hints = []
+    for _ in range(word_length):
+        hints.append(code % 3 + CORRECT)
+        code //= 3
+    return hints
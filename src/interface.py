@@ -1,26 +1,38 @@
-from src.logic import Logic
+from src.logic import MAX_GUESSES, Logic
 from src.popup import PopUpWarning, PopUpWindow
-from src.board import GridBoard, HINTS_COLORS, MAX_GUESS, WORD_LENGTH
-from src.keyboard import Keyboard, KEYBOARD_LAYOUT, DEFAULT_KEY_COLOR
+from src.board import GridBoard
+from src.keyboard import Keyboard, KEYBOARD_LETTERS, DEFAULT_KEY_COLOR, text_keys
+from src.assets import FONT_PATH, answer_list_path, word_list_path
+from src.stats import PLAYER, get_stats_store
+from src.scheduler import get_scheduler
+from src.lexicon import WORD_LENGTH, get_lexicon
+from src.replay import GameRecord, get_replay_writer
+from src.metrics import metrics
 import asyncio
 import flet as ft
-import os
-import sys
+import time
+from collections import deque
 
-def get_asset_path(relative_path: str) -> str:
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+FRAME_SECONDS = 1 / 60
+MAX_PENDING_KEYS = 256
 
 
 class Wordle:
-    def __init__ (self, page: ft.Page):
+    def __init__ (self, page: ft.Page, font_path: str = FONT_PATH, word_length: int = WORD_LENGTH, max_guesses: int = MAX_GUESSES, daily: bool = False, seed: int = None, hard_mode: bool = False, player: str = PLAYER):
         self.page=page
-        font_path = get_asset_path(os.path.join("data", "karnakcondensed-normal-700.ttf"))
         page.fonts = {"default" : font_path}
-        self.json_file_path = get_asset_path(os.path.join("data", "wordle.json"))
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        self.daily = daily
+        self.seed = seed
+        self.hard_mode = hard_mode
+        self.player = player # stats source, one per browser in web mode so players do not share streaks
+        self.json_file_path = word_list_path(word_length)
+        self.answers_path = answer_list_path(word_length)
+        self.last_input = time.monotonic()
+        self.last_render = 0.0
+        self.pending_keys = deque()
+        self.draining = False
         self.page.title = "Wordle"
         self.page.vertical_alignment = ft.MainAxisAlignment.START
         self.page.scroll = ft.ScrollMode.ADAPTIVE
@@ -29,86 +41,150 @@ class Wordle:
         self.current_guess_row = 0
         self.current_guess_col = 0
         self.current_letter_col = 0
-        self.board = GridBoard()
-        self.wordle_logic=Logic(file_path=self.json_file_path)
+        self.board = self.create_board()
+        self.replay_writer = get_replay_writer()
+        self.replay_record = None
+        self.wordle_logic=self.create_logic()
         self.game_over = False
         self.win = False
         self.guesses = list[list[str]]
-        self.guesses = [[""] * WORD_LENGTH for _ in range(MAX_GUESS)]
+        self.guesses = [[""] * self.word_length for _ in range(self.max_guesses)]
         self.keyboard = Keyboard(key_press_handler=self.handle_key_press)
         #self.keyboard_controls = self.keyboard.keyboard_controls
         #self.key_statuses = self.keyboard.key_statuses
         
-        self.game_over_window = PopUpWindow(
-            title="",
-            message="",
-            on_restart=self.restart_game_and_close_window,
-            on_close=self.close_game_over_window
-        )
-        
-        self.game_warning_window = PopUpWarning (
-            title = "Warning",
-            message = "",
-            on_close=self.close_warning_window
-        )
+        self._game_over_window = None
+        self._game_warning_window = None
         
         self.main_content_column = self.create_main_content()
         self.page.add(
             ft.Container(height=30),
             self.main_content_column
         )
-        self.page.overlay.append(self.game_over_window)
-        self.page.overlay.append(self.game_warning_window)
         self.draw_ui()
     
     async def on_keyboard_event(self, e: ft.KeyboardEvent):
-        if self.game_over or self.game_warning_window.visible or self.game_over_window.visible:
-            return
         key = e.key.upper()
-        if not self.game_over: 
-            if key in KEYBOARD_LAYOUT[0] + KEYBOARD_LAYOUT[1] + KEYBOARD_LAYOUT[2]:
-                await self.update_ui("key_press", key)
-            elif key == "ENTER":
-                await self.update_ui("key_press", "ENTER")
-            elif key == "BACKSPACE":
-                await self.update_ui("key_press", "BACKSPACE")
+        if e.ctrl or e.meta:
+            if key == "V":
+                await self.type_text(await self.page.get_clipboard_async() or "")
+            return
+        if key in KEYBOARD_LETTERS or key == "ENTER" or key == "BACKSPACE":
+            await self.queue_keys(key)
 
     async def handle_key_press(self, e: ft.ControlEvent):
-        if self.game_over or self.game_warning_window.visible or self.game_over_window.visible:
-            return
-        key = e.control.data
-        if not self.game_over:
-            self.update_ui("key_press", key)
-                
-    async def update_ui(self, action: str, key: str = None):
-        is_input_key = key in KEYBOARD_LAYOUT[0] + KEYBOARD_LAYOUT[1] + KEYBOARD_LAYOUT[2]
-        if is_input_key:
-            self.wordle_logic.get_letter(key)
-        elif key == "BACKSPACE":
-            self.wordle_logic.remove_letter()
-        elif key == "ENTER":
-            await self.submit_answer() 
+        await self.queue_keys(e.control.data)
+
+    async def type_text(self, text: str):
+        await self.queue_keys(*text_keys(text))
+
+    async def queue_keys(self, *keys: str):
+        if self.game_over or self.dialog_visible():
             return
-        self.sync_ui_state_with_logic()
-        self.board.update_board_display(self.wordle_logic.history, self.guesses, self.current_guess_row, self.current_guess_col, self.current_letter_col, self.game_over)
+        self.last_input = time.monotonic()
+        room = MAX_PENDING_KEYS - len(self.pending_keys)
+        if len(keys) > room:
+            metrics.count("dropped_keys", len(keys) - room)
+            keys = keys[:max(room, 0)]
+        self.pending_keys.extend(keys)
+        metrics.count("keys", len(keys))
+        if self.draining:
+            return # the running drain picks these up on its next frame
+        self.draining = True
+        try:
+            while self.pending_keys:
+                wait = self.last_render + FRAME_SECONDS - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                await self.drain_keys()
+        finally:
+            self.draining = False
+
+    async def drain_keys(self):
+        typed_at = None # when this burst of letters started, for the "input" stage
+        while self.pending_keys:
+            key = self.pending_keys.popleft()
+            if self.replay_record is not None:
+                self.replay_record.key(key)
+            if key == "ENTER":
+                if typed_at is not None:
+                    self.render_typed(typed_at)
+                    typed_at = None
+                await self.submit_answer() # timed as validate and reveal; keys typed meanwhile wait in the queue
+                if self.game_over or self.dialog_visible():
+                    self.pending_keys.clear()
+                    return
+            else:
+                if typed_at is None:
+                    typed_at = time.perf_counter()
+                if key == "BACKSPACE":
+                    self.wordle_logic.remove_letter()
+                else:
+                    self.wordle_logic.get_letter(key)
+        if typed_at is not None:
+            self.render_typed(typed_at)
+
+    def render_typed(self, typed_at: float):
+        self.render_input()
+        if metrics.enabled:
+            metrics.observe("input", time.perf_counter() - typed_at)
+
+    def render_input(self):
+        self.last_render = time.monotonic()
+        metrics.count("renders")
+        with metrics.timer("sync_ui_state"):
+            self.sync_ui_state_with_logic()
+        with metrics.timer("update_board_display"):
+            changed = self.board.update_board_display(self.wordle_logic.history, self.guesses, self.current_guess_row, self.current_guess_col, self.current_letter_col, self.game_over)
         #self.keyboard.update_keyboard_display()
-        self.page.update() 
+        if changed:
+            metrics.count("page_updates")
+            metrics.count("updated_controls", len(changed))
+            with metrics.timer("page_update"):
+                self.page.update(*changed)
      
     def sync_ui_state_with_logic(self):
-        self.guesses = [[""] * WORD_LENGTH for _ in range(MAX_GUESS)]
-        for r, (word, hints) in enumerate(self.wordle_logic.history):
-            self.guesses[r] = list(word)
-        current_word = self.wordle_logic.get_current_word()
-        current_row = len(self.wordle_logic.history) #
-
-        if current_row < MAX_GUESS:
-            self.guesses[current_row][:len(current_word)] = list(current_word)
+        state = self.wordle_logic.state
+        current_row = state.rows
+        for r in range(max(0, current_row - 1), min(current_row + 1, self.max_guesses)):
+            row = self.guesses[r]
+            for c in range(self.word_length):
+                row[c] = state.letter(r, c)
+
+        if current_row < self.max_guesses:
             self.current_guess_row = current_row 
-            self.current_letter_col = len(current_word)
+            self.current_letter_col = state.col
         else:
             self.current_guess_row = current_row 
             self.current_letter_col = 0 
     
+    def create_board(self) -> GridBoard:
+        return GridBoard(self.max_guesses, self.word_length)
+
+    def create_logic(self) -> Logic:
+        logic = Logic(file_path=self.json_file_path, answer=self.next_answer(), word_length=self.word_length, max_guesses=self.max_guesses, hard_mode=self.hard_mode, answers_path=self.answers_path)
+        if self.replay_writer is not None:
+            self.replay_record = GameRecord(logic.answer, self.max_guesses, hard_mode=self.hard_mode)
+        return logic
+
+    def next_answer(self) -> str:
+        if not self.daily and self.seed is None:
+            return None
+        scheduler = get_scheduler(get_lexicon(self.answers_path, self.word_length))
+        if self.daily:
+            return scheduler.daily_word()
+        answer = scheduler.seeded_word(self.seed)
+        self.seed += 1
+        return answer
+
+    def create_board_content(self) -> ft.Control:
+        return ft.Column(
+            alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            controls=self.board.create_board_controls(self.guesses),
+            spacing=5 
+        )
+
     def create_main_content(self):
         return ft.Column(
             alignment = ft.MainAxisAlignment.START,
@@ -116,12 +192,7 @@ class Wordle:
             controls = [
                 ft.Text("WORDLE", size=32, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE),
                 ft.Divider(height=10, color=ft.Colors.TRANSPARENT),
-                ft.Column(
-                    alignment=ft.MainAxisAlignment.CENTER,
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    controls=self.board.create_board_controls(self.guesses),
-                    spacing=5 
-                ),
+                self.create_board_content(),
                 ft.Divider(height=20, color=ft.Colors.TRANSPARENT),
                 ft.Column(
                     alignment=ft.MainAxisAlignment.CENTER,
@@ -139,41 +210,54 @@ class Wordle:
         self.page.update()
         
     async def submit_answer(self): # Made async
-            hints, is_win, submitted = self.wordle_logic.submit_guess()
+            with metrics.timer("validate"):
+                hints, is_win, submitted = self.wordle_logic.submit_guess()
+            metrics.count("validations")
 
             if not submitted:
+                metrics.count("rejected_words")
                 current_word = self.wordle_logic.get_current_word()
-                if len(current_word) < WORD_LENGTH:
+                if len(current_word) < self.word_length:
                     self.show_warning_dialog("NOT ENOUGH LETTERS!")
-                else:
+                elif current_word not in self.wordle_logic.word_list:
                     self.show_warning_dialog("WORD NOT FOUND!")
+                else:
+                    self.show_warning_dialog(self.wordle_logic.hard_mode_violation())
                 return
             else:
                 guess_word = self.wordle_logic.history[-1][0]
                 self.sync_ui_state_with_logic()
-                await self.board.animate_row_bouncing(self.current_guess_row - 1, hints, list(guess_word))
-                colors_and_chars = []
-                for i, (letter, hint) in enumerate( zip ( guess_word, hints ) ):
-                    key_color = HINTS_COLORS.get(hint)
-                    if key_color:
-                        colors_and_chars.append((key_color, letter.upper()))
-                self.keyboard.set_answer_state(colors_and_chars)
+                changed_keys = self.keyboard.set_answer_state(self.wordle_logic.constraints)
+                with metrics.timer("reveal"):
+                    await self.board.animate_row_bouncing(self.current_guess_row - 1, hints, list(guess_word), self.page.update, changed_keys)
             if is_win:
                 self.game_over = True
                 self.win = True
-                self.show_game_over_dialog("You Win!", f"Congratulations! You guessed the word in {len(self.wordle_logic.history)}/6 tries.", ft.Colors.GREEN_400)
-            elif len(self.wordle_logic.history) >= MAX_GUESS:
+                self.record_finished_game()
+                self.show_game_over_dialog("You Win!", f"Congratulations! You guessed the word in {len(self.wordle_logic.history)}/{self.max_guesses} tries.", ft.Colors.GREEN_400)
+            elif len(self.wordle_logic.history) >= self.max_guesses:
                 self.game_over = True
+                self.record_finished_game()
                 self.show_game_over_dialog("Game Over", f"You ran out of guesses! The word was **{self.wordle_logic.answer}**.", ft.Colors.YELLOW_400)
-            else:
-                self.page.update()
             
+    def record_finished_game(self):
+        logic = self.wordle_logic
+        get_stats_store().record_game(logic.answer, len(logic.history), self.win, self.word_length, self.max_guesses, source=f"{self.player}-hard" if self.hard_mode else self.player)
+        if self.replay_record is not None:
+            self.replay_writer.write_game(self.replay_record)
+            self.replay_record = None
+
     def restart_game_and_close_window(self, e = None):
-            self.wordle_logic = Logic(file_path=self.json_file_path)
+            if self.daily and self.game_over:
+                # one daily game per day: keep the finished board instead of dealing the same word again
+                self.close_game_over_window(e)
+                return
+            self.wordle_logic = self.create_logic()
+            self.pending_keys.clear()
             self.current_guess_row = 0
             self.current_guess_col = 0
             self.current_letter_col = 0
-            self.guesses = [[""] * WORD_LENGTH for _ in range(MAX_GUESS)]
+            self.guesses = [[""] * self.word_length for _ in range(self.max_guesses)]
             self.game_over = False
             self.win = False
             self.keyboard.reset() 
@@ -190,11 +274,41 @@ class Wordle:
             self.page.update()
 
 
+    @property
+    def game_over_window(self) -> PopUpWindow:
+        if self._game_over_window is None:
+            self._game_over_window = PopUpWindow(
+                title="",
+                message="",
+                on_restart=self.restart_game_and_close_window,
+                on_close=self.close_game_over_window
+            )
+            self.page.overlay.append(self._game_over_window)
+        return self._game_over_window
+
+    @property
+    def game_warning_window(self) -> PopUpWarning:
+        if self._game_warning_window is None:
+            self._game_warning_window = PopUpWarning (
+                title = "Warning",
+                message = "",
+                on_close=self.close_warning_window
+            )
+            self.page.overlay.append(self._game_warning_window)
+        return self._game_warning_window
+
+    def dialog_visible(self) -> bool:
+        return any(window is not None and window.visible for window in (self._game_over_window, self._game_warning_window))
+
     def close_game_over_window(self, e=None):
+        if self._game_over_window is None:
+            return
         self.game_over_window.visible = False
         self.page.update()
 
     def show_game_over_dialog(self, title: str, message: str, color: ft.Colors):
+        if self.daily:
+            message += " Come back tomorrow for a new word."
         self.game_over_window.update_content(title, message, color)
         self.game_over_window.visible = True
         self.page.update()
@@ -206,6 +320,8 @@ class Wordle:
         self.page.run_task(auto_fade)
     
     def close_warning_window(self, e=None):
+        if self._game_warning_window is None:
+            return
         self.game_warning_window.visible = False
         self.page.update()
 
@@ -219,4 +335,11 @@ class Wordle:
             if self.game_warning_window.visible:
                 self.game_warning_window.visible = False
                 self.page.update()
-        self.page.run_task(auto_fade)
\ No newline at end of file
+        self.page.run_task(auto_fade)
+
+    def close(self, message: str = "Session expired. Reload the page to play again."):
+        self.page.on_keyboard_event = None
+        self.page.overlay.clear()
+        self.page.clean()
+        self.page.add(ft.Text(message, size=24, color=ft.Colors.WHITE))
+        self.wordle_logic = None
\ No newline at end of file
@@ -1,5 +1,6 @@
 from src.popup import PopUpWarning, PopUpWindow
 from src.board import HINTS_COLORS
+from src.constraints import Constraints, key_hints
 import flet as ft
 
 KEYBOARD_LAYOUT = [
@@ -7,6 +8,17 @@ KEYBOARD_LAYOUT = [
     "ASDFGHJKL",
     "ZXCVBNM" 
 ]
+KEYBOARD_LETTERS = frozenset("".join(KEYBOARD_LAYOUT))
+TEXT_KEYS = {"\n": "ENTER", "\r": "ENTER", "\b": "BACKSPACE"}
+
+def text_keys(text: str) -> list[str]:
+    keys = []
+    for char in text.upper():
+        if char in KEYBOARD_LETTERS:
+            keys.append(char)
+        elif char in TEXT_KEYS:
+            keys.append(TEXT_KEYS[char])
+    return keys
 
 DEFAULT_KEY_COLOR = ft.Colors.BLUE_GREY_600
 
@@ -59,18 +71,16 @@ class Keyboard:
         self.keyboard_controls[key_name] = key_container
         return key_container
     
-    def set_answer_state(self, lst: list[tuple[str, str]]):
-        for (boxColor, char) in lst:
-            char_upper = char.upper() 
-            t = self.keyboard_controls.get(char_upper)
-            if not t:
+    def set_answer_state(self, *constraints: Constraints) -> list:
+        changed = []
+        for letter, hint in key_hints(*constraints).items():
+            t = self.keyboard_controls.get(letter)
+            if not t or t.bgcolor == HINTS_COLORS[hint]:
                 continue
-            if t.bgcolor == HINTS_COLORS[1]:
-                continue       
-            t.bgcolor = boxColor
-            t.update()
+            t.bgcolor = HINTS_COLORS[hint]
+            changed.append(t)
+        return changed
             
     def reset(self):
         for key, control in self.keyboard_controls.items():
-            control.bgcolor = DEFAULT_KEY_COLOR
-            control.update()
\ No newline at end of file
+            control.bgcolor = DEFAULT_KEY_COLOR
\ No newline at end of file
@@ -0,0 +1,171 @@
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+import threading
+from itertools import accumulate
+
+WORD_LENGTH = 5
+
+# Packed lexicon: 12-byte header followed by the words as sorted,
+# fixed-width ASCII records with no separators.
+BINARY_MAGIC = b"WLEX"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sBBHI") # magic, version, word length, reserved, count
+
+def playable(word: str, word_length: int) -> bool:
+    return len(word) == word_length and word.isascii() and word.isalpha() # the keyboard and the .bin format are both A-Z only
+
+class Lexicon:
+
+    def __init__(self, words: list[str], word_length: int = WORD_LENGTH, weights: dict[str, int] = None):
+        self.word_length = word_length
+        # sorted like pack_words, so a JSON list and its packed .bin index words identically
+        self.words = tuple(sorted({w.lower() for w in words if playable(w, word_length)}))
+        self.index = {w: i for i, w in enumerate(self.words)}
+        self.cum_weights = list(accumulate(weights.get(w, 0) for w in self.words)) if weights else None
+        self._digest = None
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self.index
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __getitem__(self, i: int) -> str:
+        return self.words[i]
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def index_of(self, word: str) -> int:
+        return self.index.get(word.lower(), -1)
+
+    @property
+    def digest(self) -> str:
+        if self._digest is None:
+            self._digest = lexicon_digest(self)
+        return self._digest
+
+    def random_word(self, rng: random.Random = None) -> str:
+        rng = rng or random
+        if self.cum_weights:
+            return self.words[bisect.bisect_right(self.cum_weights, rng.random() * self.cum_weights[-1])]
+        return self.words[rng.randrange(len(self.words))]
+
+class MappedLexicon:
+
+    def __init__(self, file_path: str):
+        with open(file_path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, word_length, _, count = BINARY_HEADER.unpack_from(self.buffer, 0)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f"{file_path} is not a packed lexicon")
+        if BINARY_HEADER.size + count * word_length > len(self.buffer):
+            raise ValueError(f"{file_path} is truncated")
+        self.word_length = word_length
+        self.count = count
+        self.offset = BINARY_HEADER.size
+        self._digest = None
+
+    def record(self, i: int) -> bytes:
+        start = self.offset + i * self.word_length
+        return self.buffer[start:start + self.word_length]
+
+    def __contains__(self, word: str) -> bool:
+        return self.index_of(word) >= 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return self.record(i).decode("ascii")
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.record(i).decode("ascii")
+
+    def index_of(self, word: str) -> int:
+        if len(word) != self.word_length or not word.isascii():
+            return -1
+        key = word.lower().encode("ascii")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.record(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self.record(lo) == key:
+            return lo
+        return -1
+
+    @property
+    def digest(self) -> str:
+        if self._digest is None:
+            self._digest = lexicon_digest(self)
+        return self._digest
+
+    def random_word(self, rng: random.Random = None) -> str:
+        rng = rng or random
+        return self[rng.randrange(self.count)]
+
+def pack_words(words, out_path: str, word_length: int = WORD_LENGTH) -> int:
+    packed = sorted({w.lower().encode("ascii") for w in words if playable(w, word_length)})
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, word_length, 0, len(packed)))
+        file.write(b"".join(packed))
+    os.replace(tmp_path, out_path)
+    return len(packed)
+
+def convert_json(json_path: str, out_path: str, word_length: int = WORD_LENGTH) -> int:
+    return pack_words(load_json_words(json_path), out_path, word_length)
+
+def lexicon_digest(words) -> str:
+    digest = hashlib.sha256()
+    for word in words:
+        digest.update(word.encode("ascii"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+def load_json_words(file_path: str) -> list[str] | dict[str, int]: # a dict maps each word to its answer weight
+    with open(file_path, "r") as file:
+        return json.load(file)
+
+_lexicons = {}
+_lexicons_lock = threading.Lock()
+
+def get_lexicon(file_path: str, word_length: int = WORD_LENGTH) -> Lexicon:
+    key = (os.path.abspath(file_path), word_length)
+    lexicon = _lexicons.get(key)
+    if lexicon is None:
+        with _lexicons_lock:
+            lexicon = _lexicons.get(key)
+            if lexicon is None:
+                if file_path.endswith(".bin"):
+                    lexicon = MappedLexicon(file_path)
+                    if lexicon.word_length != word_length:
+                        raise ValueError(f"{file_path} holds {lexicon.word_length}-letter words, not {word_length}")
+                else:
+                    words = load_json_words(file_path)
+                    lexicon = Lexicon(words, word_length, words if isinstance(words, dict) else None)
+                _lexicons[key] = lexicon
+    return lexicon
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack a JSON word list into the binary lexicon format.")
+    parser.add_argument("source", help="JSON array of words, or object of word weights")
+    parser.add_argument("output", help="destination .bin file")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH)
+    args = parser.parse_args()
+    count = convert_json(args.source, args.output, args.length)
+    print(f"packed {count} words into {args.output}")
@@ -1,44 +1,76 @@
-import random
-import json
 from collections import Counter
+from src.constraints import Constraints
+from src.hints import CORRECT, PRESENT, ABSENT, decode_pattern, encode_pattern
+from src.lexicon import WORD_LENGTH, Lexicon, get_lexicon
+from src.state import GameState
 
-CORRECT = 1
-PRESENT = 2
-ABSENT = 3
+MAX_GUESSES = 6
 
 class Logic:
+    __slots__ = ("word_list", "answer_list", "answer", "max_guesses", "state", "track_candidates", "hard_mode", "_candidates", "_constraints", "_history")
 
-    def load_data(self,file_path: str):
-        file = open(file_path,"r")
-        data=json.load(file)
-        return data
+    def load_data(self,file_path: str, word_length: int = WORD_LENGTH) -> Lexicon:
+        return get_lexicon(file_path, word_length)
     
-    def get_hidden_word(self,word_list: list) -> str:
-        word=random.choice(word_list).upper()
+    def get_hidden_word(self,word_list: Lexicon) -> str:
+        word=word_list.random_word().upper()
         return word
     
-    def __init__ (self, file_path: str):
-        self.word_list = self.load_data(file_path)
-        self.answer=self.get_hidden_word(self.word_list)
-        self.max_guesses=6
-        self.current_guess=""
-        self.history = []
+    def __init__ (self, file_path: str, answer: str = None, word_length: int = WORD_LENGTH, max_guesses: int = MAX_GUESSES, track_candidates: bool = True, hard_mode: bool = False, answers_path: str = None):
+        self.word_list = self.load_data(file_path, word_length)
+        self.answer_list = self.load_data(answers_path, word_length) if answers_path else self.word_list # what the answer can be, a subset of what may be guessed
+        self.answer=answer.upper() if answer else self.get_hidden_word(self.answer_list)
+        self.max_guesses=max_guesses
+        self.state = GameState(len(self.answer), self.max_guesses)
+        self._history = []
+        self.track_candidates = track_candidates
+        self._candidates = None
+        self.hard_mode = hard_mode
+        self._constraints = None
+
+    @property
+    def current_guess(self) -> str:
+        return self.state.current_word()
+
+    @property
+    def candidates(self):
+        if self._candidates is None and self.track_candidates:
+            from src.candidates import CandidateSet # pulls in numpy, so only on first use
+            self._candidates = CandidateSet(self.answer_list)
+            for word, hints in self.history:
+                self._candidates.narrow(word, hints)
+        return self._candidates
+
+    @property
+    def constraints(self) -> Constraints:
+        if self._constraints is None:
+            self._constraints = Constraints(self.state.word_length)
+        history = self.history
+        while self._constraints.rows < len(history):
+            self._constraints.add(*history[self._constraints.rows])
+        return self._constraints
+
+    @property
+    def history(self) -> list[tuple[str, list[int]]]:
+        state = self.state
+        while len(self._history) < state.rows:
+            r = len(self._history)
+            self._history.append((state.row_word(r), decode_pattern(state.patterns[r], state.word_length)))
+        return self._history
         
     def get_current_word(self) -> str:
         return self.current_guess
     
     def get_remaining_guess(self) -> int:
-        return self.max_guesses - len(self.history)
+        return self.max_guesses - self.state.rows
     
     def get_letter(self, letter: str):
-        if not letter.isalpha():
+        if not letter.isalpha() or not letter.isascii():
             return
-        if len(self.current_guess) < len(self.answer):
-            self.current_guess += letter.upper()
+        self.state.push_letter(letter.upper())
     
     def remove_letter(self):
-        if len(self.current_guess)>0:
-            self.current_guess=self.current_guess[:-1]
+        self.state.pop_letter()
             
     def compare_word(self) -> list[int]:
         hints = [ABSENT] * len(self.answer)
@@ -56,16 +88,26 @@ class Logic:
                     times_letter_appear[guess[i]]-=1
         return hints
     
+    def hard_mode_violation(self) -> str:
+        if not self.hard_mode:
+            return None
+        return self.constraints.violation(self.current_guess)
+
     def submit_guess(self) -> tuple[list[int], bool, bool]: #return hints, win game, accept submit
-        if len(self.current_guess) != len(self.answer) or self.current_guess.lower() not in self.word_list:
+        guess = self.current_guess
+        if len(guess) != len(self.answer) or guess not in self.word_list:
+            return [], False, False
+        if self.hard_mode_violation() is not None:
             return [], False, False
         hints=self.compare_word()
         win = False
         if all(h == CORRECT for h in hints):
             win=True
-        self.history.append((self.current_guess, hints))
-        self.current_guess=""
+        self.state.submit(encode_pattern(hints))
+        if self._candidates is not None:
+            self._candidates.narrow(guess, hints)
         return hints, win, True
     
     def get_max_guess(self) -> int: return self.max_guesses
-    def get_ans_length(self) -> int: return len(self.answer)
\ No newline at end of file
+    def get_ans_length(self) -> int: return len(self.answer)
+    def get_remaining_count(self) -> int: return len(self.candidates) if self.candidates is not None else -1
\ No newline at end of file
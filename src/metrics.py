@@ -0,0 +1,145 @@
+import bisect
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Bucket upper bounds in seconds, doubling from 50us to ~13s.
+BUCKETS = tuple(0.00005 * 2 ** i for i in range(19))
+QUANTILES = (0.5, 0.95, 0.99)
+
+class Histogram:
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return BUCKETS[i] if i < len(BUCKETS) else float("inf")
+        return float("inf")
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name: str):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_TIMER = _NullTimer()
+
+class Metrics:
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def timer(self, name: str):
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name)
+
+    def observe(self, name: str, seconds: float):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name: str, n: int = 1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "stages": {
+                    name: {
+                        "count": h.count,
+                        "mean": h.total / h.count if h.count else 0.0,
+                        **{f"p{int(q * 100)}": h.quantile(q) for q in QUANTILES},
+                    }
+                    for name, h in self.histograms.items()
+                },
+                "counters": dict(self.counters),
+            }
+
+    def prometheus_text(self) -> str:
+        lines = ["# TYPE wordle_stage_seconds summary"]
+        with self.lock:
+            for name, h in sorted(self.histograms.items()):
+                for q in QUANTILES:
+                    lines.append(f'wordle_stage_seconds{{stage="{name}",quantile="{q}"}} {h.quantile(q)}')
+                lines.append(f'wordle_stage_seconds_sum{{stage="{name}"}} {h.total}')
+                lines.append(f'wordle_stage_seconds_count{{stage="{name}"}} {h.count}')
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE wordle_{name}_total counter")
+                lines.append(f"wordle_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(self.snapshot(), file, indent=2)
+        os.replace(tmp_path, path)
+
+metrics = Metrics(enabled=os.environ.get("WORDLE_METRICS", "") not in ("", "0"))
+
+def serve_prometheus(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = metrics.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+def write_periodically(path: str, interval: float = 10.0):
+    def loop():
+        while True:
+            time.sleep(interval)
+            metrics.write(path)
+    threading.Thread(target=loop, name="metrics-file", daemon=True).start()
@@ -0,0 +1,109 @@
+from src.interface import Wordle
+from src.multilogic import MultiLogic
+from src.board import GridBoard
+from src.lexicon import WORD_LENGTH
+from src.assets import FONT_PATH
+from src.stats import PLAYER, get_stats_store
+import flet as ft
+import time
+
+CELL_SIZES = {4: 40, 8: 30, 16: 22}
+
+class MultiWordle(Wordle):
+    def __init__ (self, page: ft.Page, boards: int = 4, font_path: str = FONT_PATH, word_length: int = WORD_LENGTH, max_guesses: int = None, player: str = PLAYER):
+        self.board_count = boards
+        self.cell_size = CELL_SIZES.get(boards, 30)
+        super().__init__(page, font_path=font_path, word_length=word_length, max_guesses=max_guesses or boards + 5, player=player)
+        self.page.title = f"Wordle x{boards}"
+
+    def create_board(self) -> list[GridBoard]:
+        return [GridBoard(self.max_guesses, self.word_length, self.cell_size) for _ in range(self.board_count)]
+
+    def create_logic(self) -> MultiLogic:
+        return MultiLogic(self.json_file_path, boards=self.board_count, word_length=self.word_length, max_guesses=self.max_guesses, answers_path=self.answers_path)
+
+    def create_board_content(self) -> ft.Control:
+        spacing = max(2, self.cell_size // 12)
+        board_width = self.word_length * (self.cell_size + spacing) + 16
+        board_height = self.max_guesses * (self.cell_size + spacing) + 16
+        return ft.GridView(
+            controls=[
+                ft.Container(
+                    content=ft.Column(controls=board.create_board_controls(self.guesses), spacing=spacing),
+                    padding=8,
+                )
+                for board in self.board
+            ],
+            max_extent=board_width,
+            child_aspect_ratio=board_width / board_height,
+            height=min(2, -(-self.board_count // 4)) * board_height + 20,
+            width=min(4, self.board_count) * (board_width + 10),
+            spacing=10,
+            run_spacing=10,
+        )
+
+    def draw_ui(self):
+        for board in self.board:
+            board.update_board_display([], self.guesses, 0, 0, 0, self.game_over)
+        self.page.update()
+
+    def render_input(self):
+        self.last_render = time.monotonic()
+        state = self.wordle_logic.state
+        row = state.rows
+        if row >= self.max_guesses:
+            return
+        letters = [state.letter(row, c) for c in range(self.word_length)]
+        changed = []
+        for b in self.wordle_logic.open_boards():
+            self.board[b].update_row(row, None, letters, row, state.col, self.game_over, changed)
+        if changed:
+            self.page.update(*changed)
+
+    async def submit_answer(self):
+        logic = self.wordle_logic
+        row = logic.state.rows
+        letters = [logic.state.letter(row, c) for c in range(self.word_length)] if row < self.max_guesses else []
+        results, all_solved, submitted = logic.submit_guess()
+        if not submitted:
+            if len(logic.get_current_word()) < self.word_length:
+                self.show_warning_dialog("NOT ENOUGH LETTERS!")
+            else:
+                self.show_warning_dialog("WORD NOT FOUND!")
+            return
+        guess = logic.guesses[-1]
+        changed = []
+        for b, hints in results.items():
+            self.board[b].update_row(row, (guess, hints), letters, row, 0, True, changed)
+        if row + 1 < self.max_guesses:
+            empty = [""] * self.word_length
+            for b in logic.open_boards():
+                self.board[b].update_row(row + 1, None, empty, row + 1, 0, False, changed)
+        changed.extend(self.keyboard.set_answer_state(*logic.constraints))
+        self.page.update(*changed)
+        if all_solved:
+            self.game_over = True
+            self.win = True
+            self.record_finished_game()
+            self.show_game_over_dialog("You Win!", f"You solved all {self.board_count} boards in {len(logic.guesses)}/{self.max_guesses} tries.", ft.Colors.GREEN_400)
+        elif logic.get_remaining_guess() <= 0:
+            self.game_over = True
+            self.record_finished_game()
+            missed = ", ".join(logic.answers[b] for b in logic.open_boards())
+            self.show_game_over_dialog("Game Over", f"You ran out of guesses! Missed: **{missed}**.", ft.Colors.YELLOW_400)
+
+    def record_finished_game(self):
+        logic = self.wordle_logic
+        get_stats_store().record_game(",".join(logic.answers), len(logic.guesses), self.win, self.word_length, self.max_guesses, source=f"{self.player}-x{self.board_count}")
+
+    def restart_game_and_close_window(self, e = None):
+        self.wordle_logic = self.create_logic()
+        self.pending_keys.clear()
+        self.guesses = [[""] * self.word_length for _ in range(self.max_guesses)]
+        self.game_over = False
+        self.win = False
+        self.keyboard.reset()
+        for board in self.board:
+            board.reset()
+        self.close_game_over_window(e)
+        self.draw_ui()
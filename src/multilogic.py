@@ -0,0 +1,67 @@
+import random
+import numpy as np
+from src.constraints import Constraints
+from src.feedback import encode_words, pattern_matrix
+from src.hints import SOLVED, decode_pattern
+from src.lexicon import WORD_LENGTH, Lexicon, get_lexicon
+from src.state import GameState
+
+BOARD_COUNTS = (4, 8, 16)
+
+class MultiLogic:
+
+    def __init__(self, file_path: str, boards: int = 4, answers: list[str] = None, word_length: int = WORD_LENGTH, max_guesses: int = None, answers_path: str = None):
+        self.word_list = get_lexicon(file_path, word_length)
+        if answers is None:
+            answers = self.get_hidden_words(get_lexicon(answers_path, word_length) if answers_path else self.word_list, boards)
+        self.answers = [a.upper() for a in answers]
+        self.answer_codes = encode_words(self.answers, word_length)
+        self.max_guesses = max_guesses or len(self.answers) + 5
+        self.state = GameState(word_length, self.max_guesses)
+        self.guesses = []
+        self.board_hints = [[] for _ in self.answers]
+        self.solved_at = [-1] * len(self.answers)
+        self.constraints = [Constraints(word_length) for _ in self.answers]
+
+    def get_hidden_words(self, word_list: Lexicon, boards: int) -> list[str]:
+        return [word_list[i] for i in random.sample(range(len(word_list)), boards)]
+
+    def get_current_word(self) -> str:
+        return self.state.current_word()
+
+    def get_remaining_guess(self) -> int:
+        return self.max_guesses - len(self.guesses)
+
+    def get_letter(self, letter: str):
+        if not letter.isalpha() or not letter.isascii():
+            return
+        self.state.push_letter(letter.upper())
+
+    def remove_letter(self):
+        self.state.pop_letter()
+
+    def open_boards(self) -> list[int]:
+        return [b for b, row in enumerate(self.solved_at) if row < 0]
+
+    def board_history(self, board: int) -> list[tuple[str, list[int]]]:
+        return list(zip(self.guesses, self.board_hints[board]))
+
+    def submit_guess(self) -> tuple[dict[int, list[int]], bool, bool]: #return hints per open board, all solved, accept submit
+        guess = self.get_current_word()
+        if len(guess) != self.state.word_length or guess not in self.word_list:
+            return {}, False, False
+        boards = self.open_boards()
+        guess_codes = np.frombuffer(guess.lower().encode("ascii"), dtype=np.uint8)[None, :]
+        patterns = pattern_matrix(guess_codes, self.answer_codes[boards])[0]
+        row = len(self.guesses)
+        self.guesses.append(guess)
+        self.state.submit(SOLVED) # per-board hints live in board_hints
+        results = {}
+        for b, pattern in zip(boards, patterns):
+            hints = decode_pattern(int(pattern), self.state.word_length)
+            self.board_hints[b].append(hints)
+            self.constraints[b].add(guess, hints)
+            results[b] = hints
+            if pattern == SOLVED:
+                self.solved_at[b] = row
+        return results, all(row >= 0 for row in self.solved_at), True
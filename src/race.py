@@ -0,0 +1,235 @@
+import argparse
+import asyncio
+import json
+import random
+import struct
+import time
+from src.assets import answer_list_path, word_list_path
+from src.hints import SOLVED, encode_pattern
+from src.lexicon import WORD_LENGTH, get_lexicon
+from src.logic import MAX_GUESSES, Logic
+from src.metrics import QUANTILES, Histogram
+
+# Race protocol. Every message is one bytes payload whose first byte is its type.
+#
+#   server -> client
+#     START    "S" u8 seat  u8 seats  u8 word_length  u8 max_guesses
+#     PROGRESS "P" u16 count, then count x (u8 seat, u8 row, u16 pattern)
+#     REJECT   "R"  the last guess was not a word
+#     END      "E" answer[word_length], then seats x (u8 solved row, u8 place), 0 for unsolved
+#   client -> server
+#     GUESS    "G" word[word_length] (ASCII)
+#
+# A pattern is the base-3 hint code from src.hints, so broadcasts carry
+# colours only and never another player's letters. PROGRESS events pile up
+# per room and go out once per tick as a single message to every seat.
+
+START = struct.Struct("<cBBBB")
+PROGRESS = struct.Struct("<cH")
+EVENT = struct.Struct("<BBH")
+REJECT = b"R"
+GUESS = b"G"
+TICK_SECONDS = 0.05
+ROOM_SIZE = 4
+
+class Player:
+    __slots__ = ("transport", "room", "seat", "logic", "solved_row", "place", "done")
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.room = None
+        self.seat = 0
+        self.logic = None
+        self.solved_row = 0
+        self.place = 0
+        self.done = False
+
+class Room:
+    __slots__ = ("answer", "players", "events", "solved", "started")
+
+    def __init__(self, answer: str):
+        self.answer = answer
+        self.players = []
+        self.events = bytearray()
+        self.solved = 0
+        self.started = False
+
+    def finished(self) -> bool:
+        return self.started and all(player.done for player in self.players)
+
+    def end_message(self) -> bytes:
+        return b"E" + self.answer.encode("ascii") + b"".join(bytes((p.solved_row, p.place)) for p in self.players)
+
+class RoomManager:
+
+    def __init__(self, file_path: str, word_length: int = WORD_LENGTH, max_guesses: int = MAX_GUESSES, room_size: int = ROOM_SIZE, tick: float = TICK_SECONDS, answers_path: str = None, rng: random.Random = None):
+        self.file_path = file_path
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        self.room_size = room_size
+        self.tick = tick
+        self.answers = get_lexicon(answers_path or file_path, word_length)
+        self.rng = rng or random.Random()
+        self.waiting = None
+        self.rooms = set()
+        self.dirty = set()
+        self.tick_seconds = Histogram()
+        self.messages = 0
+        self.bytes_sent = 0
+        self.guesses = 0
+
+    def join(self, transport) -> Player:
+        if self.waiting is None:
+            self.waiting = Room(self.answers.random_word(self.rng).upper())
+        room = self.waiting
+        player = Player(transport)
+        player.room = room
+        player.seat = len(room.players)
+        room.players.append(player)
+        if len(room.players) == self.room_size:
+            self.start(room)
+        return player
+
+    def start(self, room: Room):
+        if room is self.waiting:
+            self.waiting = None
+        room.started = True
+        self.rooms.add(room)
+        for player in room.players:
+            player.logic = Logic(self.file_path, answer=room.answer, word_length=self.word_length, max_guesses=self.max_guesses, track_candidates=False)
+            self.send(player, START.pack(b"S", player.seat, len(room.players), self.word_length, self.max_guesses))
+
+    def receive(self, player: Player, data: bytes):
+        if data[:1] == GUESS:
+            self.submit(player, data[1:].decode("ascii", "replace"))
+
+    def submit(self, player: Player, word: str):
+        room = player.room
+        if not room.started or player.done:
+            return
+        logic = player.logic
+        for _ in range(logic.state.col):
+            logic.remove_letter()
+        for letter in word:
+            logic.get_letter(letter)
+        hints, win, submitted = logic.submit_guess()
+        if not submitted:
+            self.send(player, REJECT)
+            return
+        self.guesses += 1
+        row = logic.state.rows
+        room.events += EVENT.pack(player.seat, row, encode_pattern(hints))
+        if win:
+            room.solved += 1
+            player.solved_row = row
+            player.place = room.solved
+            player.done = True
+        elif logic.get_remaining_guess() <= 0:
+            player.done = True
+        self.dirty.add(room)
+
+    def leave(self, player: Player):
+        room = player.room
+        if not room.started:
+            room.players.remove(player)
+            for seat, other in enumerate(room.players):
+                other.seat = seat
+            return
+        player.done = True
+        self.dirty.add(room)
+
+    def send(self, player: Player, message: bytes):
+        self.messages += 1
+        self.bytes_sent += len(message)
+        player.transport.send(message)
+
+    def flush(self):
+        dirty, self.dirty = self.dirty, set()
+        for room in dirty:
+            messages = []
+            if room.events:
+                messages.append(PROGRESS.pack(b"P", len(room.events) // EVENT.size) + room.events)
+                room.events = bytearray()
+            if room.finished():
+                messages.append(room.end_message())
+                self.rooms.discard(room)
+            for message in messages:
+                for player in room.players:
+                    self.send(player, message)
+
+    async def run_forever(self):
+        while True:
+            await asyncio.sleep(self.tick)
+            start = time.perf_counter()
+            self.flush()
+            self.tick_seconds.observe(time.perf_counter() - start)
+
+class LoopbackTransport:
+
+    def __init__(self):
+        self.inbox = asyncio.Queue()
+
+    def send(self, message: bytes):
+        self.inbox.put_nowait(message)
+
+    async def receive(self) -> bytes:
+        return await self.inbox.get()
+
+def own_events(message: bytes, seat: int):
+    for offset in range(PROGRESS.size, len(message), EVENT.size):
+        event_seat, row, pattern = EVENT.unpack_from(message, offset)
+        if event_seat == seat:
+            yield row, pattern
+
+async def simulated_player(manager: RoomManager, rng: random.Random, think: tuple[float, float]) -> tuple[int, int]: #return guesses, place
+    transport = LoopbackTransport()
+    player = manager.join(transport)
+    guessing = False
+    while True:
+        message = await transport.receive()
+        kind = message[:1]
+        if kind == b"S" or kind == REJECT:
+            guessing = True
+        elif kind == b"P":
+            for row, pattern in own_events(message, player.seat):
+                guessing = pattern != SOLVED and row < manager.max_guesses
+        elif kind == b"E":
+            seat_offset = 1 + manager.word_length + 2 * player.seat
+            return message[seat_offset], message[seat_offset + 1]
+        if guessing:
+            guessing = False
+            await asyncio.sleep(rng.uniform(*think))
+            manager.receive(player, GUESS + manager.answers.random_word(rng).encode("ascii"))
+
+async def load_test(file_path: str, rooms: int, room_size: int, tick: float, think: tuple[float, float], seed: int, word_length: int = WORD_LENGTH, answers_path: str = None) -> dict:
+    rng = random.Random(seed)
+    manager = RoomManager(file_path, word_length, room_size=room_size, tick=tick, answers_path=answers_path, rng=rng)
+    ticker = asyncio.create_task(manager.run_forever())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(simulated_player(manager, random.Random(rng.random()), think) for _ in range(rooms * room_size)))
+    elapsed = time.perf_counter() - start
+    ticker.cancel()
+    return {
+        "rooms": rooms,
+        "players": rooms * room_size,
+        "solved": sum(1 for row, place in results if place),
+        "guesses": manager.guesses,
+        "messages": manager.messages,
+        "bytes": manager.bytes_sent,
+        "seconds": elapsed,
+        "guesses_per_sec": manager.guesses / elapsed if elapsed > 0 else None,
+        "ticks": manager.tick_seconds.count,
+        **{f"tick_p{int(q * 100)}": manager.tick_seconds.quantile(q) for q in QUANTILES},
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test race rooms with simulated players over the loopback transport.")
+    parser.add_argument("--rooms", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=ROOM_SIZE, help="players per room")
+    parser.add_argument("--tick", type=float, default=TICK_SECONDS, help="seconds between progress broadcasts")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.05, 0.5), metavar=("MIN", "MAX"), help="seconds a simulated player waits before each guess")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    report = asyncio.run(load_test(word_list_path(args.length), args.rooms, args.players, args.tick, tuple(args.think), args.seed, args.length, answer_list_path(args.length)))
+    print(json.dumps(report, indent=2))
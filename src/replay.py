@@ -0,0 +1,178 @@
+import argparse
+import json
+import os
+import struct
+import threading
+import time
+from collections import Counter
+from src.assets import word_list_path
+from src.lexicon import WORD_LENGTH
+from src.logic import Logic
+
+# Replay file format, version 2. All integers are little-endian.
+#
+#   file   := header game*
+#   header := "WRPL" u8 version u8[3] reserved
+#   game   := u8 word_length  u8 max_guesses  u8 flags  f64 started_at (unix seconds)  u16 event_count
+#             answer[word_length] (ASCII, upper case)
+#             event[event_count]
+#   flags  := bit 0 set for hard mode
+#   event  := one byte: "A".."Z" types a letter, 0x08 is BACKSPACE, 0x0D is ENTER
+#
+# Version 1 games have no flags byte and are read as normal mode.
+#
+# Games are appended whole once they finish, so a reader only ever needs one
+# game in memory and a file that is still being written stays readable up to
+# its last complete game.
+
+REPLAY_MAGIC = b"WRPL"
+REPLAY_VERSION = 2
+FILE_HEADER = struct.Struct("<4sB3x")
+GAME_HEADER = struct.Struct("<BBBdH")
+GAME_HEADERS = {1: struct.Struct("<BBdH"), 2: GAME_HEADER}
+HARD_MODE = 0x01
+BACKSPACE = 0x08
+ENTER = 0x0D
+REPLAY_PATH = os.environ.get("WORDLE_REPLAY_PATH")
+
+def encode_key(key: str) -> int:
+    if key == "BACKSPACE":
+        return BACKSPACE
+    if key == "ENTER":
+        return ENTER
+    return ord(key.upper())
+
+def decode_key(event: int) -> str:
+    if event == BACKSPACE:
+        return "BACKSPACE"
+    if event == ENTER:
+        return "ENTER"
+    return chr(event)
+
+class GameRecord:
+    __slots__ = ("answer", "max_guesses", "hard_mode", "started_at", "events")
+
+    def __init__(self, answer: str, max_guesses: int, started_at: float = None, events: bytes = b"", hard_mode: bool = False):
+        self.answer = answer.upper()
+        self.max_guesses = max_guesses
+        self.hard_mode = hard_mode
+        self.started_at = time.time() if started_at is None else started_at
+        self.events = bytearray(events)
+
+    def key(self, key: str):
+        self.events.append(encode_key(key))
+
+    def keys(self):
+        return (decode_key(event) for event in self.events)
+
+    def to_bytes(self) -> bytes:
+        events = bytes(self.events[:0xFFFF])
+        header = GAME_HEADER.pack(len(self.answer), self.max_guesses, HARD_MODE if self.hard_mode else 0, self.started_at, len(events))
+        return header + self.answer.encode("ascii") + events
+
+class ReplayWriter:
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        if os.path.exists(path) and os.path.getsize(path) >= FILE_HEADER.size:
+            with open(path, "rb") as file:
+                magic, version = FILE_HEADER.unpack(file.read(FILE_HEADER.size))
+            if version != REPLAY_VERSION: # keep older games readable, start a new file for this version
+                os.replace(path, f"{path}.v{version}")
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as file:
+                file.write(FILE_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION))
+        self.file = open(path, "ab")
+
+    def write_game(self, record: GameRecord):
+        data = record.to_bytes()
+        with self.lock:
+            self.file.write(data)
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+def get_replay_writer(path: str = None) -> ReplayWriter:
+    path = path or REPLAY_PATH
+    if not path:
+        return None
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None:
+            writer = _writers[path] = ReplayWriter(path)
+        return writer
+
+def read_games(path: str):
+    with open(path, "rb") as file:
+        magic, version = FILE_HEADER.unpack(file.read(FILE_HEADER.size))
+        if magic != REPLAY_MAGIC or version not in GAME_HEADERS:
+            raise ValueError(f"{path} is not a replay file")
+        game_header = GAME_HEADERS[version]
+        while True:
+            header = file.read(game_header.size)
+            if len(header) < game_header.size:
+                return
+            if version == 1:
+                word_length, max_guesses, started_at, event_count = game_header.unpack(header)
+                flags = 0
+            else:
+                word_length, max_guesses, flags, started_at, event_count = game_header.unpack(header)
+            body = file.read(word_length + event_count)
+            if len(body) < word_length + event_count:
+                return
+            yield GameRecord(body[:word_length].decode("ascii"), max_guesses, started_at, body[word_length:], hard_mode=bool(flags & HARD_MODE))
+
+def replay_game(file_path: str, record: GameRecord) -> tuple[int, bool, int]: #return guesses, win game, rejected submits
+    logic = Logic(file_path, answer=record.answer, word_length=len(record.answer), max_guesses=record.max_guesses, track_candidates=False, hard_mode=record.hard_mode)
+    rejected = 0
+    for key in record.keys():
+        if key == "ENTER":
+            hints, win, submitted = logic.submit_guess()
+            if not submitted:
+                rejected += 1
+            elif win:
+                return len(logic.history), True, rejected
+            if logic.get_remaining_guess() <= 0:
+                break
+        elif key == "BACKSPACE":
+            logic.remove_letter()
+        else:
+            logic.get_letter(key)
+    return len(logic.history), False, rejected
+
+def replay_file(path: str, file_path: str):
+    for record in read_games(path):
+        yield record, replay_game(file_path, record)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded games headlessly against Logic.")
+    parser.add_argument("replays", help="replay file written by the game")
+    parser.add_argument("--words", default=None, help="word list to validate against, defaults to the list for --length")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH)
+    args = parser.parse_args()
+    words = args.words or word_list_path(args.length)
+    start = time.perf_counter()
+    games = wins = rejected = keys = 0
+    distribution = Counter()
+    for record, (guesses, win, bad) in replay_file(args.replays, words):
+        games += 1
+        wins += win
+        rejected += bad
+        keys += len(record.events)
+        distribution[str(guesses) if win else "X"] += 1
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "games": games,
+        "wins": wins,
+        "rejected_submits": rejected,
+        "events": keys,
+        "distribution": dict(sorted(distribution.items())),
+        "seconds": elapsed,
+        "games_per_sec": games / elapsed if elapsed > 0 else None,
+    }, indent=2))
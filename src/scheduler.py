@@ -0,0 +1,67 @@
+import datetime
+import os
+import random
+import threading
+from array import array
+from src.assets import CACHE_DIR
+
+EPOCH = datetime.date(2021, 6, 19)
+DEFAULT_SEED = 20210619
+
+class AnswerScheduler:
+
+    def __init__(self, lexicon, seed: int = DEFAULT_SEED, cache_dir: str = None):
+        self.lexicon = lexicon
+        self.seed = seed
+        cache_dir = cache_dir or CACHE_DIR
+        self.path = os.path.join(cache_dir, f"schedule-{lexicon.word_length}-{lexicon.digest[:16]}-{seed}.bin")
+        self.order = self.load_order() or self.build_order()
+        self.daily = {}
+
+    def load_order(self) -> array:
+        order = array("I")
+        try:
+            with open(self.path, "rb") as file:
+                order.frombytes(file.read())
+        except OSError:
+            return None
+        if len(order) != len(self.lexicon):
+            return None
+        return order
+
+    def build_order(self) -> array:
+        indices = list(range(len(self.lexicon)))
+        random.Random(self.seed).shuffle(indices)
+        order = array("I", indices)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            order.tofile(file)
+        os.replace(tmp_path, self.path)
+        return order
+
+    def seeded_word(self, seed: int) -> str:
+        return self.lexicon[self.order[seed % len(self.order)]]
+
+    def day_number(self, day: datetime.date = None) -> int:
+        return ((day or datetime.date.today()) - EPOCH).days
+
+    def daily_word(self, day: datetime.date = None) -> str:
+        number = self.day_number(day)
+        word = self.daily.get(number)
+        if word is None:
+            word = self.daily[number] = self.seeded_word(number)
+        return word
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+def get_scheduler(lexicon, seed: int = DEFAULT_SEED) -> AnswerScheduler:
+    key = (lexicon, seed)
+    scheduler = _schedulers.get(key)
+    if scheduler is None:
+        with _schedulers_lock:
+            scheduler = _schedulers.get(key)
+            if scheduler is None:
+                scheduler = _schedulers[key] = AnswerScheduler(lexicon, seed)
+    return scheduler
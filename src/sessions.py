@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+import flet as ft
+from src.stats import PLAYER
+
+PLAYER_ID_KEY = "wordle.player_id"
+
+logger = logging.getLogger(__name__)
+
+def process_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        return 0
+
+def browser_player(page: ft.Page) -> str:
+    # session ids change on every reload, so stats are keyed on an id kept in the browser's local storage
+    try:
+        player_id = page.client_storage.get(PLAYER_ID_KEY)
+        if not player_id:
+            player_id = uuid.uuid4().hex
+            page.client_storage.set(PLAYER_ID_KEY, player_id)
+    except Exception:
+        logger.exception("no client storage for session %s, stats will not carry over", page.session_id)
+        player_id = page.session_id
+    return f"{PLAYER}:{player_id}"
+
+class SessionManager:
+
+    def __init__(self, idle_timeout: float = 900, sweep_interval: float = 60):
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.sessions = {}
+        self.peak_sessions = 0
+        self.baseline_rss = process_rss_bytes()
+        self.sweeper_started = False
+
+    def open(self, page: ft.Page, game):
+        self.sessions[page.session_id] = game
+        self.peak_sessions = max(self.peak_sessions, len(self.sessions))
+        page.on_disconnect = lambda e: self.close(page.session_id)
+        page.on_close = lambda e: self.close(page.session_id)
+        if not self.sweeper_started:
+            self.sweeper_started = True
+            page.run_task(self.sweep_forever)
+
+    def close(self, session_id: str):
+        self.sessions.pop(session_id, None)
+
+    def evict_idle(self, now: float = None) -> int:
+        now = time.monotonic() if now is None else now
+        idle = [sid for sid, game in self.sessions.items() if now - game.last_input > self.idle_timeout]
+        for sid in idle:
+            game = self.sessions.pop(sid)
+            try:
+                game.close()
+            except Exception:
+                logger.exception("failed to close idle session %s", sid)
+        return len(idle)
+
+    def stats(self) -> dict:
+        rss = process_rss_bytes()
+        sessions = len(self.sessions)
+        return {
+            "sessions": sessions,
+            "peak_sessions": self.peak_sessions,
+            "rss_bytes": rss,
+            "bytes_per_session": (rss - self.baseline_rss) // sessions if sessions else None,
+        }
+
+    async def sweep_forever(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            evicted = self.evict_idle()
+            logger.info("sessions: %s, evicted %d", self.stats(), evicted)
@@ -0,0 +1,142 @@
+import argparse
+import json
+import os
+import random
+import time
+import numpy as np
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from src.assets import word_list_path
+from src.feedback import encode_lexicon
+from src.lexicon import WORD_LENGTH, get_lexicon
+from src.logic import MAX_GUESSES, Logic
+from src.solver import Solver
+from src.stats import StatsStore, get_stats_store
+
+class FirstCandidateStrategy:
+    name = "first"
+
+    def __init__(self, file_path: str, word_length: int = WORD_LENGTH):
+        pass
+
+    def guess(self, logic: Logic) -> str:
+        return next(iter(logic.candidates))
+
+class RandomConsistentStrategy:
+    name = "random"
+
+    def __init__(self, file_path: str, word_length: int = WORD_LENGTH):
+        pass
+
+    def guess(self, logic: Logic) -> str:
+        # Seeded per game and row so results do not depend on how answers are
+        # split across workers; the seed never influences which words qualify.
+        candidates = logic.candidates
+        rng = random.Random(f"{logic.answer}:{logic.state.rows}")
+        return candidates.lexicon[int(candidates.indices[rng.randrange(len(candidates))])]
+
+class LetterFrequencyStrategy:
+    name = "frequency"
+
+    def __init__(self, file_path: str, word_length: int = WORD_LENGTH):
+        self.words = encode_lexicon(get_lexicon(file_path, word_length))
+
+    def guess(self, logic: Logic) -> str:
+        candidates = logic.candidates
+        letters = self.words[candidates.indices].astype(np.intp) - ord("a")
+        present = np.zeros((len(letters), 26), dtype=np.int64)
+        present[np.arange(len(letters))[:, None], letters] = 1
+        scores = present @ present.sum(axis=0) # each distinct letter counts once per word
+        return candidates.lexicon[int(candidates.indices[np.argmax(scores)])]
+
+class EntropyStrategy:
+    name = "entropy"
+    metric = "entropy"
+
+    def __init__(self, file_path: str, word_length: int = WORD_LENGTH):
+        self.solver = Solver(file_path, workers=1, word_length=word_length, metric=self.metric)
+
+    def guess(self, logic: Logic) -> str:
+        return self.solver.suggest(logic.candidates)
+
+class MinimaxStrategy(EntropyStrategy):
+    name = "minimax"
+    metric = "minimax"
+
+STRATEGIES = {strategy.name: strategy for strategy in (FirstCandidateStrategy, RandomConsistentStrategy, LetterFrequencyStrategy, EntropyStrategy, MinimaxStrategy)}
+
+def play_game(file_path: str, answer: str, strategy) -> int: # guesses used, 0 for a loss
+    logic = Logic(file_path, answer=answer, word_length=len(answer))
+    while logic.get_remaining_guess() > 0:
+        for letter in strategy.guess(logic):
+            logic.get_letter(letter)
+        hints, win, submitted = logic.submit_guess()
+        if not submitted:
+            raise ValueError(f"strategy {strategy.name} played an invalid word {logic.get_current_word()}")
+        if logic.candidates is not None and answer.lower() not in logic.candidates:
+            raise ValueError(f"candidate filtering dropped the answer {answer} after {logic.history[-1][0]}")
+        if win:
+            return logic.state.rows
+    return 0
+
+_worker = {}
+
+def _init_worker(file_path: str, strategy_name: str, word_length: int):
+    _worker["file_path"] = file_path
+    _worker["strategy"] = STRATEGIES[strategy_name](file_path, word_length)
+
+def _play_chunk(answers: list[str]) -> list[int]:
+    return [play_game(_worker["file_path"], answer, _worker["strategy"]) for answer in answers]
+
+def simulate(file_path: str, strategy_name: str, answers: list[str] = None, workers: int = None, word_length: int = WORD_LENGTH, stats: StatsStore = None) -> dict:
+    lexicon = get_lexicon(file_path, word_length)
+    answers = list(lexicon) if answers is None else answers
+    workers = workers or os.cpu_count() or 1
+    _init_worker(file_path, strategy_name, word_length) # builds any feedback table before the clock starts; forked workers inherit it
+    start = time.perf_counter()
+    if workers <= 1:
+        results = _play_chunk(answers)
+    else:
+        step = max(1, len(answers) // (workers * 8))
+        chunks = [answers[i:i + step] for i in range(0, len(answers), step)]
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(file_path, strategy_name, word_length)) as pool:
+            results = [r for chunk in pool.map(_play_chunk, chunks) for r in chunk]
+    elapsed = time.perf_counter() - start
+    if stats is not None:
+        for answer, guesses in zip(answers, results):
+            stats.record_game(answer, guesses or MAX_GUESSES, guesses > 0, word_length, MAX_GUESSES, source=f"simulation:{strategy_name}")
+    wins = [r for r in results if r > 0]
+    distribution = Counter(str(r) if r > 0 else "X" for r in results)
+    return {
+        "strategy": strategy_name,
+        "word_list": os.path.basename(file_path),
+        "word_length": word_length,
+        "games": len(results),
+        "wins": len(wins),
+        "failures": len(results) - len(wins),
+        "mean_guesses": sum(wins) / len(wins) if wins else None,
+        "distribution": dict(sorted(distribution.items())),
+        "seconds": elapsed,
+        "games_per_sec": len(results) / elapsed if elapsed > 0 else None,
+        "workers": workers,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play every answer headlessly and report throughput.")
+    parser.add_argument("--words", default=None, help="word list to play, defaults to the list for --length")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--limit", type=int, default=None, help="only play the first N answers")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--record", action="store_true", help="also store every game in the statistics database")
+    args = parser.parse_args()
+    words = args.words or word_list_path(args.length)
+    answers = list(get_lexicon(words, args.length))[:args.limit]
+    stats = get_stats_store() if args.record else None
+    report = simulate(words, args.strategy, answers, args.workers, args.length, stats)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    print(text)
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from src.candidates import CandidateSet
+from src.feedback import encode_lexicon, load_feedback_table, pattern_matrix
+from src.lexicon import WORD_LENGTH, get_lexicon
+
+PARALLEL_MIN_CELLS = 1 << 21
+
+_openings = {}
+
+def bucket_counts(patterns: np.ndarray, pattern_count: int) -> np.ndarray:
+    rows = patterns.shape[0]
+    offsets = np.arange(rows, dtype=np.int64)[:, None] * pattern_count
+    return np.bincount((offsets + patterns).ravel(), minlength=rows * pattern_count).reshape(rows, pattern_count)
+
+def entropy_scores(patterns: np.ndarray, pattern_count: int) -> np.ndarray:
+    answers = patterns.shape[1]
+    counts = bucket_counts(patterns, pattern_count).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted = np.where(counts > 0, counts * np.log2(counts), 0.0)
+    return np.log2(answers) - weighted.sum(axis=1) / answers
+
+def minimax_scores(patterns: np.ndarray, pattern_count: int) -> np.ndarray:
+    # negated worst-case bucket, so that like entropy a higher score is better
+    return -bucket_counts(patterns, pattern_count).max(axis=1).astype(np.float64)
+
+METRICS = {"entropy": entropy_scores, "minimax": minimax_scores}
+
+def _score_range(file_path: str, word_length: int, use_table: bool, start: int, stop: int, candidates: np.ndarray, metric: str = "entropy") -> np.ndarray:
+    lexicon = get_lexicon(file_path, word_length)
+    if use_table:
+        patterns = load_feedback_table(lexicon).table[start:stop][:, candidates]
+    else:
+        words = encode_lexicon(lexicon)
+        patterns = pattern_matrix(words[start:stop], words[candidates])
+    return METRICS[metric](patterns, 3 ** lexicon.word_length)
+
+class Solver:
+
+    def __init__(self, file_path: str, use_table: bool = True, workers: int = None, word_length: int = WORD_LENGTH, metric: str = "entropy"):
+        self.file_path = file_path
+        self.metric = metric
+        self.lexicon = get_lexicon(file_path, word_length)
+        self.use_table = use_table
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = None
+        if use_table:
+            load_feedback_table(self.lexicon)
+
+    def score(self, candidates: np.ndarray) -> np.ndarray:
+        guess_count = len(self.lexicon)
+        if self.workers <= 1 or guess_count * len(candidates) < PARALLEL_MIN_CELLS:
+            return _score_range(self.file_path, self.lexicon.word_length, self.use_table, 0, guess_count, candidates, self.metric)
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        step = -(-guess_count // self.workers)
+        futures = [
+            self.pool.submit(_score_range, self.file_path, self.lexicon.word_length, self.use_table, start, min(start + step, guess_count), candidates, self.metric)
+            for start in range(0, guess_count, step)
+        ]
+        return np.concatenate([f.result() for f in futures])
+
+    def rank(self, candidates: CandidateSet, top_n: int = 10) -> list[tuple[str, float]]:
+        indices = candidates.indices
+        if candidates.lexicon is not self.lexicon: # candidates drawn from a separate answer list
+            indices = np.array([i for i in map(self.lexicon.index_of, candidates) if i >= 0], dtype=np.int32)
+        if len(indices) == 0:
+            return []
+        if len(indices) <= 2:
+            return [(self.lexicon[int(i)], float(np.log2(len(indices)))) for i in indices][:top_n]
+        first_guess = len(indices) == len(self.lexicon)
+        key = (self.lexicon.digest, self.metric, top_n)
+        if first_guess and key in _openings:
+            return _openings[key]
+        scores = self.score(indices)
+        is_candidate = np.zeros(len(self.lexicon), dtype=bool)
+        is_candidate[indices] = True
+        order = np.lexsort((~is_candidate, -scores))[:top_n]
+        ranking = [(self.lexicon[int(i)], float(scores[i])) for i in order]
+        if first_guess:
+            _openings[key] = ranking
+        return ranking
+
+    def suggest(self, candidates: CandidateSet) -> str:
+        ranking = self.rank(candidates, top_n=1)
+        return ranking[0][0] if ranking else ""
+
+    async def suggest_async(self, candidates: CandidateSet) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.suggest, candidates)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
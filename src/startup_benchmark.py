@@ -0,0 +1,73 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Runs in a fresh interpreter so every sample is a cold start. The page only
+# records when the first frame would have been sent; everything else is the
+# real game code.
+CHILD = r"""
+import asyncio, json, os, sys, time
+start = float(os.environ["WORDLE_BENCH_START"])
+marks = {}
+def mark(name):
+    marks.setdefault(name, time.time() - start)
+
+class RecordingPage:
+    def __init__(self):
+        self.overlay = []
+        self.controls = []
+        self.session_id = "bench"
+    def add(self, *controls):
+        self.controls.extend(controls)
+    def update(self, *controls):
+        mark("first_paint")
+    def run_task(self, handler, *args):
+        pass
+    def clean(self):
+        self.controls.clear()
+
+mark("interpreter")
+import flet
+mark("import_flet")
+from src.interface import Wordle
+mark("import_game")
+game = Wordle(RecordingPage())
+async def first_input():
+    await game.queue_keys("A")
+    mark("input_accepted")
+    await game.type_text("BOUT")
+    game.wordle_logic.submit_guess()
+    mark("first_validation")
+asyncio.run(first_input())
+print(json.dumps({"marks": marks, "numpy_loaded": "numpy" in sys.modules}))
+"""
+
+def run_once(cwd: str) -> dict:
+    env = dict(os.environ, WORDLE_BENCH_START=repr(time.time()))
+    env.pop("WORDLE_REPLAY_PATH", None)
+    output = subprocess.run([sys.executable, "-c", CHILD], cwd=cwd, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure cold-start time to first paint and to the first accepted input.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = [run_once(root) for _ in range(args.runs)]
+    samples = [result["marks"] for result in results]
+    report = {
+        "runs": args.runs,
+        "median_seconds": {name: statistics.median(s[name] for s in samples) for name in samples[0]},
+        "max_seconds": {name: max(s[name] for s in samples) for name in samples[0]},
+        "numpy_loaded": any(result["numpy_loaded"] for result in results),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    print(text)
@@ -0,0 +1,83 @@
+import struct
+from array import array
+
+EMPTY = 0
+MAX_GUESS_LIMIT = 255 # max guesses and rows are packed as one byte each
+STATE_HEADER = struct.Struct("<BBBB") # word length, max guesses, submitted rows, letters in current row
+
+class GameState:
+    __slots__ = ("word_length", "max_guesses", "rows", "col", "grid", "patterns")
+
+    def __init__(self, word_length: int, max_guesses: int):
+        if not 1 <= max_guesses <= MAX_GUESS_LIMIT:
+            raise ValueError(f"max guesses must be between 1 and {MAX_GUESS_LIMIT}")
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        self.rows = 0
+        self.col = 0
+        self.grid = bytearray(word_length * max_guesses)
+        self.patterns = array("I", bytes(4 * max_guesses))
+
+    def push_letter(self, letter: str) -> bool:
+        if self.rows >= self.max_guesses or self.col >= self.word_length:
+            return False
+        self.grid[self.rows * self.word_length + self.col] = ord(letter)
+        self.col += 1
+        return True
+
+    def pop_letter(self) -> bool:
+        if self.col == 0:
+            return False
+        self.col -= 1
+        self.grid[self.rows * self.word_length + self.col] = EMPTY
+        return True
+
+    def row_word(self, row: int) -> str:
+        start = row * self.word_length
+        return self.grid[start:start + self.word_length].rstrip(b"\0").decode("ascii")
+
+    def current_word(self) -> str:
+        if self.rows >= self.max_guesses:
+            return ""
+        start = self.rows * self.word_length
+        return self.grid[start:start + self.col].decode("ascii")
+
+    def letter(self, row: int, col: int) -> str:
+        code = self.grid[row * self.word_length + col]
+        return chr(code) if code else ""
+
+    def submit(self, pattern: int):
+        self.patterns[self.rows] = pattern
+        self.rows += 1
+        self.col = 0
+
+    def copy(self) -> "GameState":
+        other = GameState.__new__(GameState)
+        other.word_length = self.word_length
+        other.max_guesses = self.max_guesses
+        other.rows = self.rows
+        other.col = self.col
+        other.grid = bytearray(self.grid)
+        other.patterns = array("I", self.patterns)
+        return other
+
+    def to_bytes(self) -> bytes:
+        return STATE_HEADER.pack(self.word_length, self.max_guesses, self.rows, self.col) + bytes(self.grid) + self.patterns.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameState":
+        word_length, max_guesses, rows, col = STATE_HEADER.unpack_from(data, 0)
+        state = cls(word_length, max_guesses)
+        start = STATE_HEADER.size
+        state.rows = rows
+        state.col = col
+        state.grid[:] = data[start:start + len(state.grid)]
+        state.patterns = array("I")
+        state.patterns.frombytes(data[start + len(state.grid):start + len(state.grid) + 4 * max_guesses])
+        return state
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, GameState) and self.to_bytes() == other.to_bytes()
+
+    def __hash__(self) -> int:
+        return hash(self.to_bytes())
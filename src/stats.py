@@ -0,0 +1,150 @@
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+STATS_PATH = os.environ.get("WORDLE_STATS_PATH", os.path.join(os.path.expanduser("~"), ".wordle", "stats.sqlite3"))
+PLAYER = "player"
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    source TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    guesses INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    word_length INTEGER NOT NULL,
+    max_guesses INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS summary (
+    source TEXT PRIMARY KEY,
+    played INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    current_streak INTEGER NOT NULL,
+    max_streak INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS distribution (
+    source TEXT NOT NULL,
+    guesses INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (source, guesses)
+);
+"""
+
+INSERT_GAME = "INSERT INTO games (finished_at, source, answer, guesses, won, word_length, max_guesses) VALUES (?, ?, ?, ?, ?, ?, ?)"
+# Column names on the right-hand side of DO UPDATE refer to the row before the update.
+UPSERT_SUMMARY = """
+INSERT INTO summary (source, played, won, current_streak, max_streak) VALUES (?, 1, ?, ?, ?)
+ON CONFLICT (source) DO UPDATE SET
+    played = played + 1,
+    won = won + excluded.won,
+    current_streak = CASE WHEN excluded.won THEN current_streak + 1 ELSE 0 END,
+    max_streak = MAX(max_streak, CASE WHEN excluded.won THEN current_streak + 1 ELSE 0 END)
+"""
+UPSERT_DISTRIBUTION = """
+INSERT INTO distribution (source, guesses, count) VALUES (?, ?, 1)
+ON CONFLICT (source, guesses) DO UPDATE SET count = count + 1
+"""
+
+def connect(path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+class StatsStore:
+
+    def __init__(self, path: str = STATS_PATH, batch_size: int = 500, flush_interval: float = 1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = connect(path)
+        connection.executescript(SCHEMA)
+        connection.close()
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self.write_forever, name="stats-writer", daemon=True)
+        self.writer.start()
+
+    def record_game(self, answer: str, guesses: int, won: bool, word_length: int, max_guesses: int, source: str = PLAYER):
+        self.pending.put((time.time(), source, answer.lower(), guesses, int(won), word_length, max_guesses))
+
+    def write_forever(self):
+        connection = connect(self.path)
+        stopping = False
+        while not stopping:
+            try:
+                batch = [self.pending.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            games = [game for game in batch if game is not None]
+            stopping = len(games) < len(batch)
+            try:
+                if games:
+                    self.write_batch(connection, games)
+            except Exception: # a locked or full database costs this batch, not every later game
+                logger.exception("failed to write %d games to %s", len(games), self.path)
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+        connection.close()
+
+    def write_batch(self, connection: sqlite3.Connection, batch: list[tuple]):
+        with connection:
+            connection.executemany(INSERT_GAME, batch)
+            for finished_at, source, answer, guesses, won, word_length, max_guesses in batch:
+                connection.execute(UPSERT_SUMMARY, (source, won, won, won))
+                connection.execute(UPSERT_DISTRIBUTION, (source, guesses if won else 0))
+
+    def flush(self):
+        self.pending.join()
+
+    def summary(self, source: str = PLAYER) -> dict:
+        connection = connect(self.path)
+        try:
+            row = connection.execute("SELECT played, won, current_streak, max_streak FROM summary WHERE source = ?", (source,)).fetchone()
+            distribution = dict(connection.execute("SELECT guesses, count FROM distribution WHERE source = ? ORDER BY guesses", (source,)))
+        finally:
+            connection.close()
+        played, won, current_streak, max_streak = row or (0, 0, 0, 0)
+        return {
+            "played": played,
+            "won": won,
+            "win_rate": won / played if played else 0.0,
+            "current_streak": current_streak,
+            "max_streak": max_streak,
+            "distribution": distribution, # 0 counts losses
+        }
+
+    def close(self):
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join()
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_stats_store(path: str = STATS_PATH) -> StatsStore:
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = StatsStore(path)
+        return store
+
+@atexit.register
+def _close_stores():
+    for store in list(_stores.values()):
+        store.close()
@@ -0,0 +1,144 @@
+import argparse
+import bz2
+import gzip
+import heapq
+import json
+import math
+import os
+from src.assets import DATA_DIR
+from src.lexicon import WORD_LENGTH, pack_words
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+ANSWER_COUNT = 2500
+
+# Every reader takes an iterable of text lines and yields (word, count).
+# Word-list sources yield a count of None: they vouch that a word exists
+# but say nothing about how common it is.
+
+def read_frequency(lines):
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        word, count = parts[0], parts[1]
+        if not word.isalpha() and count.isalpha(): # "count word" layout
+            word, count = count, word
+        try:
+            yield word, float(count)
+        except ValueError:
+            continue
+
+def read_hunspell(lines):
+    for n, line in enumerate(lines):
+        if n == 0 and line.strip().isdigit(): # approximate entry count
+            continue
+        fields = line.split("/", 1)[0].split()
+        if not fields or fields[0][0].isupper(): # capitalised entries are proper nouns
+            continue
+        yield fields[0], None
+
+def read_plain(lines):
+    for line in lines:
+        fields = line.split()
+        if fields:
+            yield fields[0], None
+
+SOURCES = {
+    "frequency": read_frequency,
+    "hunspell": read_hunspell,
+    "plain": read_plain,
+}
+
+def open_text(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+def answer_weight(count: float) -> int:
+    # Corpus counts span many orders of magnitude; on a log scale common
+    # words are still favoured without a handful of them taking every game.
+    return max(1, round(math.log2(1 + count)))
+
+class LexiconBuilder:
+
+    def __init__(self, lengths: list[int] = (WORD_LENGTH,), alphabet: str = ALPHABET, min_count: float = 1):
+        self.lengths = frozenset(lengths)
+        self.alphabet = alphabet
+        self.min_count = min_count
+        self.counts = {}
+        self.listed = set()
+
+    def add_source(self, kind: str, path: str) -> int:
+        reader = SOURCES[kind]
+        lengths = self.lengths
+        alphabet = self.alphabet
+        counts = self.counts
+        kept = 0
+        with open_text(path) as file:
+            for word, count in reader(file):
+                if len(word) not in lengths:
+                    continue
+                word = word.lower()
+                if word.strip(alphabet): # something outside the alphabet is left
+                    continue
+                kept += 1
+                if count is None:
+                    self.listed.add(word)
+                else:
+                    counts[word] = counts.get(word, 0) + count
+        return kept
+
+    def guesses(self, length: int) -> list[str]:
+        words = {w for w in self.listed if len(w) == length}
+        words.update(w for w, n in self.counts.items() if len(w) == length and n >= self.min_count)
+        return sorted(words, key=lambda w: (-self.counts.get(w, 0), w))
+
+    def answers(self, length: int, limit: int = ANSWER_COUNT) -> dict[str, int]:
+        listed = {w for w in self.listed if len(w) == length}
+        pool = (
+            (n, w) for w, n in self.counts.items()
+            if len(w) == length and n >= self.min_count and (not listed or w in listed)
+        )
+        return {w: answer_weight(n) for n, w in heapq.nlargest(limit, pool)}
+
+    def write(self, out_dir: str, length: int, answer_count: int = ANSWER_COUNT, pack: bool = False) -> tuple[int, int]: #return guesses, answers written
+        guesses = self.guesses(length)
+        answers = self.answers(length, answer_count)
+        os.makedirs(out_dir, exist_ok=True)
+        write_json(os.path.join(out_dir, f"wordle-{length}.json"), guesses)
+        if answers: # without frequencies the guess list doubles as the answer list
+            write_json(os.path.join(out_dir, f"wordle-{length}-answers.json"), answers)
+        if pack:
+            pack_words(guesses, os.path.join(out_dir, f"wordle-{length}.bin"), length)
+        return len(guesses), len(answers)
+
+def write_json(path: str, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(data, file, indent=2)
+    os.replace(tmp_path, path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream raw word sources into guess and answer lists for the game.")
+    parser.add_argument("--frequency", action="append", default=[], help="'word count' lines, e.g. a corpus frequency list (.gz/.bz2 ok)")
+    parser.add_argument("--hunspell", action="append", default=[], help="Hunspell .dic file")
+    parser.add_argument("--plain", action="append", default=[], help="one word per line")
+    parser.add_argument("--length", type=int, nargs="+", default=[WORD_LENGTH])
+    parser.add_argument("--alphabet", default=ALPHABET, help="letters a word may use")
+    parser.add_argument("--min-count", type=float, default=1, help="drop corpus words seen fewer times than this")
+    parser.add_argument("--answers", type=int, default=ANSWER_COUNT, help="answers to keep per length, most frequent first")
+    parser.add_argument("--out", default=DATA_DIR)
+    parser.add_argument("--pack", action="store_true", help="also write the packed .bin guess list")
+    args = parser.parse_args()
+    if not set(args.alphabet) <= set(ALPHABET):
+        parser.error("the game can only show the letters a-z")
+    builder = LexiconBuilder(args.length, args.alphabet, args.min_count)
+    for kind in SOURCES:
+        for path in getattr(args, kind):
+            kept = builder.add_source(kind, path)
+            print(f"{path}: kept {kept} entries")
+    for length in args.length:
+        guesses, answers = builder.write(args.out, length, args.answers, args.pack)
+        print(f"{length} letters: {guesses} guesses, {answers} answers")
@@ -0,0 +1,64 @@
+import json
+import pytest
+from src.constraints import Constraints, key_hints
+from src.hints import CORRECT, PRESENT, ABSENT
+from src.logic import Logic
+
+WORDS = ["crane", "slate", "trace", "react", "cater", "eerie", "geese", "tepee", "emcee", "spoon", "flame"]
+
+def hints_for(file_path: str, guess: str, answer: str) -> list[int]:
+    logic = Logic(file_path, answer=answer, track_candidates=False)
+    for letter in guess:
+        logic.get_letter(letter)
+    return logic.compare_word()
+
+@pytest.fixture
+def words_path(tmp_path):
+    file_path = str(tmp_path / "words.json")
+    with open(file_path, "w") as file:
+        json.dump(WORDS, file)
+    return file_path
+
+def test_green_letter_must_stay_in_place():
+    c = Constraints(5)
+    c.add("crane", [CORRECT, ABSENT, ABSENT, ABSENT, ABSENT])
+    assert c.violation("slate") == "1ST LETTER MUST BE C"
+    assert c.violation("chomp") is None
+
+def test_yellow_letter_must_be_reused():
+    c = Constraints(5)
+    c.add("slate", [ABSENT, ABSENT, PRESENT, ABSENT, ABSENT])
+    assert c.violation("crone") == "GUESS MUST CONTAIN A"
+    assert c.violation("crane") is None
+
+def test_duplicate_letters_set_a_minimum_count():
+    c = Constraints(5)
+    c.add("geese", [ABSENT, PRESENT, PRESENT, ABSENT, ABSENT]) # two E's are in the answer, not three
+    assert c.violation("crane") == "GUESS MUST CONTAIN E"
+    assert c.violation("eerie") is None
+    assert c.min_counts == {"E": 2}
+
+def test_later_rows_only_raise_the_minimum():
+    c = Constraints(5)
+    c.add("eerie", [PRESENT, PRESENT, ABSENT, ABSENT, ABSENT])
+    c.add("crane", [ABSENT, ABSENT, ABSENT, ABSENT, CORRECT])
+    assert c.min_counts["E"] == 2
+    assert c.violation("geese") is None
+
+@pytest.mark.parametrize("answer", WORDS)
+def test_answer_is_never_rejected(words_path, answer):
+    c = Constraints(5)
+    for guess in WORDS:
+        c.add(guess, hints_for(words_path, guess, answer))
+        assert c.violation(answer) is None, (guess, answer)
+
+def test_key_hints_prefer_green_over_yellow():
+    first = Constraints(5)
+    first.add("trace", [PRESENT, ABSENT, CORRECT, ABSENT, ABSENT])
+    second = Constraints(5)
+    second.add("react", [ABSENT, ABSENT, PRESENT, ABSENT, CORRECT])
+    hints = key_hints(first, second)
+    assert hints["A"] == CORRECT # green on one board beats yellow on the other
+    assert hints["T"] == CORRECT
+    assert hints["R"] == ABSENT
+    assert "S" not in hints
@@ -0,0 +1,35 @@
+import json
+import random
+import pytest
+from src.feedback import feedback_matrix, pattern_matrix
+from src.hints import encode_pattern
+from src.logic import Logic
+
+# A small alphabet makes repeated letters, the tricky case for hints, common.
+ALPHABET = "abcde"
+WORDS_PER_LENGTH = 40
+
+def random_words(rng: random.Random, word_length: int, count: int) -> list[str]:
+    return ["".join(rng.choice(ALPHABET) for _ in range(word_length)) for _ in range(count)]
+
+def scalar_hints(file_path: str, guess: str, answer: str) -> list[int]:
+    logic = Logic(file_path, answer=answer, word_length=len(answer), track_candidates=False)
+    for letter in guess:
+        logic.get_letter(letter)
+    return logic.compare_word()
+
+@pytest.mark.parametrize("word_length", range(4, 9))
+def test_matrices_match_compare_word(tmp_path, word_length):
+    rng = random.Random(word_length)
+    guesses = random_words(rng, word_length, WORDS_PER_LENGTH)
+    answers = random_words(rng, word_length, WORDS_PER_LENGTH)
+    file_path = str(tmp_path / "words.json")
+    with open(file_path, "w") as file:
+        json.dump(guesses + answers, file)
+    hints = feedback_matrix(guesses, answers)
+    patterns = pattern_matrix(guesses, answers)
+    for g, guess in enumerate(guesses):
+        for a, answer in enumerate(answers):
+            expected = scalar_hints(file_path, guess, answer)
+            assert hints[g, a].tolist() == expected, (guess, answer)
+            assert int(patterns[g, a]) == encode_pattern(expected), (guess, answer)
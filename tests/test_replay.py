@@ -0,0 +1,64 @@
+import json
+import os
+import pytest
+from src.replay import FILE_HEADER, GAME_HEADERS, REPLAY_MAGIC, GameRecord, ReplayWriter, read_games, replay_game
+
+WORDS = ["crane", "slate", "trace", "chomp", "flame"]
+
+@pytest.fixture
+def words_path(tmp_path):
+    file_path = str(tmp_path / "words.json")
+    with open(file_path, "w") as file:
+        json.dump(WORDS, file)
+    return file_path
+
+def record(answer: str, typed: str, hard_mode: bool = False) -> GameRecord:
+    game = GameRecord(answer, 6, started_at=1700000000.5, hard_mode=hard_mode)
+    for key in typed:
+        game.key({"\n": "ENTER", "<": "BACKSPACE"}.get(key, key))
+    return game
+
+def test_round_trip(tmp_path, words_path):
+    path = str(tmp_path / "games.wrpl")
+    games = [
+        record("CRANE", "slatx<e\ncrane\n"),
+        record("CRANE", "crane\n", hard_mode=True),
+        record("TRACE", "crane\nchomp\n<<<<<trace\n", hard_mode=True), # chomp drops the A, R and E hard mode asks for
+    ]
+    writer = ReplayWriter(path)
+    for game in games:
+        writer.write_game(game)
+    writer.close()
+    read = list(read_games(path))
+    assert [(g.answer, g.max_guesses, g.hard_mode, g.started_at, bytes(g.events)) for g in read] == [(g.answer, g.max_guesses, g.hard_mode, g.started_at, bytes(g.events)) for g in games]
+    assert [replay_game(words_path, g) for g in read] == [(2, True, 0), (1, True, 0), (2, True, 1)]
+
+def test_truncated_trailing_game_is_skipped(tmp_path):
+    path = str(tmp_path / "games.wrpl")
+    writer = ReplayWriter(path)
+    writer.write_game(record("CRANE", "crane\n"))
+    writer.write_game(record("SLATE", "crane\nslate\n"))
+    writer.close()
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 3)
+    assert [g.answer for g in read_games(path)] == ["CRANE"]
+
+def test_reads_version_1_files(tmp_path, words_path):
+    path = str(tmp_path / "games.wrpl")
+    answer, events = b"CRANE", b"SLATE\rCRANE\r"
+    with open(path, "wb") as file:
+        file.write(FILE_HEADER.pack(REPLAY_MAGIC, 1))
+        file.write(GAME_HEADERS[1].pack(len(answer), 6, 1600000000.0, len(events)) + answer + events)
+    (game,) = read_games(path)
+    assert (game.answer, game.max_guesses, game.hard_mode, game.started_at) == ("CRANE", 6, False, 1600000000.0)
+    assert replay_game(words_path, game) == (2, True, 0)
+    ReplayWriter(path).close() # a new writer moves the old version aside instead of appending to it
+    assert [g.answer for g in read_games(path + ".v1")] == ["CRANE"]
+    assert list(read_games(path)) == []
+
+def test_rejects_other_files(tmp_path):
+    path = str(tmp_path / "games.wrpl")
+    with open(path, "wb") as file:
+        file.write(FILE_HEADER.pack(b"NOPE", 2))
+    with pytest.raises(ValueError):
+        list(read_games(path))
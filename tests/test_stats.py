@@ -0,0 +1,44 @@
+import pytest
+from src.stats import StatsStore
+
+@pytest.fixture
+def store(tmp_path):
+    store = StatsStore(str(tmp_path / "stats.sqlite3"))
+    yield store
+    store.close()
+
+def test_streaks_and_distribution(store):
+    for guesses, won in ((3, True), (4, True), (6, False), (3, True)):
+        store.record_game("crane", guesses, won, 5, 6)
+    store.flush()
+    assert store.summary() == {
+        "played": 4,
+        "won": 3,
+        "win_rate": 0.75,
+        "current_streak": 1,
+        "max_streak": 2,
+        "distribution": {0: 1, 3: 2, 4: 1},
+    }
+
+def test_sources_are_separate(store):
+    store.record_game("crane", 2, True, 5, 6, source="player:a")
+    store.record_game("slate", 6, False, 5, 6, source="player:b")
+    store.flush()
+    assert store.summary("player:a")["current_streak"] == 1
+    assert store.summary("player:b")["distribution"] == {0: 1}
+    assert store.summary()["played"] == 0
+
+def test_failed_batch_does_not_stop_the_writer(store):
+    write_batch = store.write_batch
+    calls = []
+    def fail_once(connection, batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise RuntimeError("disk full")
+        write_batch(connection, batch)
+    store.write_batch = fail_once
+    store.record_game("crane", 3, True, 5, 6)
+    store.flush()
+    store.record_game("crane", 4, True, 5, 6)
+    store.flush()
+    assert store.summary()["played"] == 1